@@ -0,0 +1,110 @@
+"""
+Test data and the function calls used by the benchmark suites. Each case calls one public str_util function
+on a list of *size* values
+"""
+import functools
+import random
+import string
+
+import str_util
+
+#: approximate length of the values, by name
+LENGTHS = {'short': 8, 'long': 200}
+
+_VOCABULARY_SIZE = 1000
+_ENCODE_FROM = ['&', '<', '>', '"', "'"] + list(string.ascii_uppercase[:35])
+_ENCODE_TO = ['&amp;', '&lt;', '&gt;', '&quot;', '&#39;'] + ['&#%d;' % ord(char) for char in _ENCODE_FROM[5:]]
+_MISSING = ['#missing%d' % i for i in range(10)]
+_MANY_MISSING = ['#missing%d' % i for i in range(1000)]
+
+
+@functools.lru_cache(maxsize=2)
+def make_values(size, length='short', seed=0):
+    """
+    Generate *size* random values of mixed case words, each ending with a number, e.g. 'kTsu eXa 1432'.
+    About two thirds of the values are distinct. The same arguments always return the same values
+    """
+    rnd = random.Random(seed)
+    vocabulary = [''.join(rnd.choice(string.ascii_letters) for _ in range(rnd.randint(2, 8)))
+                  for _ in range(_VOCABULARY_SIZE)]
+    words = max(1, LENGTHS[length] // 6)
+    return [' '.join(rnd.choices(vocabulary, k=words)) + ' %d' % rnd.randrange(size) for _ in range(size)]
+
+
+def _cases():
+    """
+    The benchmark cases as (name, supports ignore_case, build) tuples.
+    ``build(values, reference, ignore_case)`` returns the function to time
+    """
+    s = str_util
+    return [
+        ('to_string', False, lambda v, r, ic: lambda: [s.to_string(entry) for entry in v]),
+        ('to_list', False, lambda v, r, ic: lambda: [s.to_list(entry) for entry in v]),
+        ('is_string', False, lambda v, r, ic: lambda: [s.is_string(entry) for entry in v]),
+        ('is_list', False, lambda v, r, ic: lambda: [s.is_list(entry) for entry in v]),
+        ('is_empty', False, lambda v, r, ic: lambda: s.is_empty(v)),
+        ('trim', False, lambda v, r, ic: lambda: s.trim(v)),
+        ('implode', False, lambda v, r, ic: lambda: s.implode(v, ' ')),
+        ('propercase', False, lambda v, r, ic: lambda: s.propercase(v)),
+        ('lowercase', False, lambda v, r, ic: lambda: s.lowercase(v)),
+        ('left', True, lambda v, r, ic: lambda: s.left(v, 3, ic)),
+        ('left_find', True, lambda v, r, ic: lambda: s.left(v, ' ', ic)),
+        ('left_back', True, lambda v, r, ic: lambda: s.left_back(v, 3, ic)),
+        ('right', True, lambda v, r, ic: lambda: s.right(v, 3, ic)),
+        ('right_find', True, lambda v, r, ic: lambda: s.right(v, ' ', ic)),
+        ('right_back', True, lambda v, r, ic: lambda: s.right_back(v, 3, ic)),
+        ('word', False, lambda v, r, ic: lambda: s.word(v, 2)),
+        ('word_last', False, lambda v, r, ic: lambda: s.word(v, -1)),
+        ('words', False, lambda v, r, ic: lambda: s.words(v, [1, 2, -1])),
+        ('split_columns', False, lambda v, r, ic: lambda: s.split_columns(v)),
+        ('split_columns_some', False, lambda v, r, ic: lambda: s.split_columns(v, columns=[1, -1])),
+        ('contains', True, lambda v, r, ic: lambda: s.contains(v, _MISSING, ic)),
+        ('contains_many', True, lambda v, r, ic: lambda: s.contains(v, _MANY_MISSING, ic)),
+        ('contains_all', True, lambda v, r, ic: lambda: s.contains_all(v, _MISSING, ic)),
+        ('index_of', True, lambda v, r, ic: lambda: s.index_of(v, _MISSING[0], ic)),
+        ('index_of_str', True, lambda v, r, ic: lambda: [s.index_of(entry, 'a', ic) for entry in v]),
+        ('find_all', True, lambda v, r, ic: lambda: list(s.find_all(v, 'a', ic))),
+        ('is_member', True, lambda v, r, ic: lambda: s.is_member(v, v[::-1], ic)),
+        ('is_equal', True, lambda v, r, ic: lambda: s.is_equal(v, v[::-1], ic)),
+        ('compare', True, lambda v, r, ic: lambda: [s.compare(a, b, ic) for a, b in zip(v, r)]),
+        ('unique', True, lambda v, r, ic: lambda: s.unique(v, ic)),
+        ('unique_counts', True, lambda v, r, ic: lambda: s.unique_counts(v, ic)),
+        ('unique_counts_top', True, lambda v, r, ic: lambda: s.unique_counts(v, ic, top_k=10)),
+        ('replace', True, lambda v, r, ic: lambda: s.replace(v, r[:len(r) // 2], ['x', 'y'], ic)),
+        ('replace_substring', True, lambda v, r, ic: lambda: s.replace_substring(v, ['a', 'e'], ['4', '3'], ic)),
+        ('replace_substring_many', True,
+         lambda v, r, ic: lambda: s.replace_substring(v, _ENCODE_FROM, _ENCODE_TO, ic)),
+        ('diff', True, lambda v, r, ic: lambda: s.diff(v, r, ic)),
+        ('union', False, lambda v, r, ic: lambda: s.union(v, r)),
+        ('intersection', True, lambda v, r, ic: lambda: s.intersection(v, r, ic)),
+        ('like', True, lambda v, r, ic: lambda: s.like(v, '*a?b*', ic)),
+        ('sort', True, lambda v, r, ic: lambda: s.sort(v, ic)),
+    ]
+
+
+def cases(name_filter=None, lengths=None):
+    """
+    Return the benchmark cases as (name, function, length, ignore_case, build) tuples, where *name* is e.g.
+    'unique[short,ignore_case]'
+
+    :param str name_filter: Optional. Only return cases where the name contains this string
+    :param list lengths: Optional. The value lengths to use (default all of :data:`LENGTHS`)
+    """
+    result = []
+    for function, supports_ignore_case, build in _cases():
+        for length in lengths or list(LENGTHS):
+            for ignore_case in ([False, True] if supports_ignore_case else [False]):
+                name = '%s[%s%s]' % (function, length, ',ignore_case' if ignore_case else '')
+                if name_filter and name_filter not in name:
+                    continue
+                result.append((name, function, length, ignore_case, build))
+    return result
+
+
+def prepare(build, size, length, ignore_case):
+    """
+    Create the test data, and return the function to benchmark
+    """
+    values = make_values(size, length)
+    reference = make_values(size, length, seed=1)[:size // 2] + values[:size // 2]
+    return build(values, reference, ignore_case)
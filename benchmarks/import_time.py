@@ -0,0 +1,81 @@
+"""
+Measures how long it takes to import str_util, in a fresh interpreter for each run.
+
+The submodules (compiled replacements, keyword matcher, like patterns, streaming and pipelines) are only imported
+when they are first used. The ``original imports`` scenario adds the modules the package imported up front before
+the imports were made lazy (``re`` and ``fnmatch``), which is the baseline the savings are reported against.
+The ``eager`` scenario imports all submodules up front, to show what the lazy loading avoids today.
+
+Run from the repository root::
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 50
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LAZY_MODULES = ['replacer', 'replace_map', 'automaton', 'globbing', 'streaming', 'pipeline', 'folded',
+                'list_index', 'tokenized', 'column', 'encoded', 'bloom']
+
+SCENARIOS = [
+    ('import str_util', 'import str_util'),
+    ('from str_util import word', 'from str_util import word'),
+    ('first replace_substring call', 'import str_util; str_util.replace_substring("a", "a", "b")'),
+    ('original imports (re, fnmatch)', 'import str_util, re, fnmatch'),
+    ('eager (all submodules)', 'import str_util, ' + ', '.join('str_util.' + name for name in LAZY_MODULES)),
+]
+
+_SCRIPT = '''
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+%s
+print(time.perf_counter() - start)
+print(' '.join(sorted(set(sys.modules) - before)))
+'''
+
+
+def measure(statement, runs=20):
+    """
+    Run the statement in *runs* fresh interpreters
+
+    :return: (median seconds, list of modules imported by the statement)
+    """
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # measure imports from cached bytecode, like an installed package
+    timings = []
+    modules = []
+    for _ in range(runs + 1):  # the first run compiles and caches the bytecode
+        output = subprocess.run([sys.executable, '-c', _SCRIPT % statement], cwd=ROOT, env=env, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout.splitlines()
+        timings.append(float(output[0]))
+        modules = output[1].split() if len(output) > 1 else []
+    return statistics.median(timings[1:]), modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import time of str_util')
+    parser.add_argument('--runs', type=int, default=20, help='number of interpreters per scenario (default 20)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, statement in SCENARIOS:
+        seconds, modules = measure(statement, args.runs)
+        results[name] = seconds
+        print('%-30s %8.2f ms   %3d modules imported' % (name, seconds * 1000, len(modules)))
+    lazy = results['import str_util']
+    original = results['original imports (re, fnmatch)']
+    eager = results['eager (all submodules)']
+    print('Lazy imports save %.2f ms (%.0f%%) on "import str_util", compared with the original imports'
+          % ((original - lazy) * 1000, (1 - lazy / original) * 100))
+    print('Importing all submodules up front would add %.2f ms' % ((eager - lazy) * 1000))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
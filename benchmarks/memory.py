@@ -0,0 +1,129 @@
+"""
+Memory benchmarks for the public str_util functions, measured with :mod:`tracemalloc`.
+
+For each function and input size, two numbers are reported:
+
+* peak live: the highest amount of memory allocated at the same time during the call, on top of the input data
+* live after call: the memory still allocated when the call returns, which is mostly the result
+
+tracemalloc only tracks the memory blocks which are alive, so the total number of bytes allocated during a call
+(counting blocks which were freed again) can't be measured. The peak is the number which is compared with a baseline.
+
+Run from the repository root::
+
+    python -m benchmarks.memory --save memory.json         # store a baseline
+    python -m benchmarks.memory --compare memory.json      # exit code 1 if the peak memory grew
+
+tracemalloc slows down Python code considerably, so the default sizes are smaller than for the speed benchmarks.
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from benchmarks.cases import LENGTHS, cases, prepare
+from benchmarks.speed import save
+
+SIZES = [1000, 10000, 100000]
+
+# peaks below this are dominated by interpreter noise, and are never reported as regressions
+MIN_BYTES = 64 * 1024
+
+
+def measure(function):
+    """
+    Call the function once while tracing memory allocations
+
+    :return: (peak live bytes, bytes live after the call, seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        result = function()
+        seconds = time.perf_counter() - start
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak, retained, seconds
+
+
+def run(sizes=None, name_filter=None, lengths=None, max_seconds=5.0, out=sys.stdout):
+    """
+    Run the benchmarks
+
+    :return: the results as a dict, see :func:`benchmarks.speed.save`
+    """
+    results = {}
+    for name, _, length, ignore_case, build in cases(name_filter, lengths):
+        peaks = {}
+        retained = {}
+        for size in sizes or SIZES:
+            peak, retained[str(size)], seconds = measure(prepare(build, size, length, ignore_case))
+            peaks[str(size)] = peak
+            print('%-45s %9d  peak live %12d bytes %8.1f bytes/value  live after call %12d bytes'
+                  % (name, size, peak, peak / size, retained[str(size)]), file=out)
+            if seconds > max_seconds:
+                break
+        results[name] = {'peak': peaks, 'retained': retained}
+    return results
+
+
+def compare(results, filename, threshold=0.1):
+    """
+    Compare the peak memory with a saved baseline
+
+    :param float threshold: allowed relative increase of the peak memory, e.g. 0.1 for 10%
+    :return: list of regression messages. Empty if no peak grew more than the threshold
+    """
+    with open(filename) as file:
+        baseline = json.load(file)['results']
+
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        for size, peak in result['peak'].items():
+            old = baseline[name]['peak'].get(size)
+            if old is None or peak < MIN_BYTES:
+                continue
+            if peak > old * (1 + threshold):
+                regressions.append('%s size %s: peak %d -> %d bytes (%+.0f%%)'
+                                   % (name, size, old, peak, (peak / max(old, 1) - 1) * 100))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Memory benchmarks for str_util')
+    parser.add_argument('--sizes', help='comma separated list sizes (default %s)' % ','.join(map(str, SIZES)))
+    parser.add_argument('--filter', help='only run cases where the name contains this string')
+    parser.add_argument('--lengths', help='comma separated value lengths: %s' % ','.join(LENGTHS))
+    parser.add_argument('--max-seconds', type=float, default=5.0,
+                        help='skip larger sizes when a run takes longer than this (default 5.0)')
+    parser.add_argument('--save', metavar='FILE', help='save the results as JSON')
+    parser.add_argument('--compare', metavar='FILE', help='compare with results saved by --save')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='allowed relative increase of the peak memory when comparing (default 0.1)')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else SIZES
+    lengths = args.lengths.split(',') if args.lengths else None
+
+    results = run(sizes, args.filter, lengths, args.max_seconds)
+    if args.save:
+        save(results, args.save)
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for regression in regressions:
+            print('REGRESSION: ' + regression)
+        if regressions:
+            return 1
+        print('No regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Speed benchmarks for the public str_util functions.
+
+Every function is timed on lists of increasing size, with short and long values and with ignore_case on and off.
+The report shows the throughput (values per second) and the scaling exponent: the slope of time against size on
+a log-log scale. 1.0 is linear, and 2.0 is quadratic.
+
+Run from the repository root::
+
+    python -m benchmarks.speed                              # all cases, sizes 10 .. 1,000,000
+    python -m benchmarks.speed --filter unique --max-size 100000
+    python -m benchmarks.speed --save baseline.json         # store the results
+    python -m benchmarks.speed --compare baseline.json      # exit code 1 if anything got slower
+
+A size is skipped when the previous size took more than ``--max-seconds``, so quadratic functions don't run
+forever.
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+
+from benchmarks.cases import LENGTHS, cases, prepare
+
+SIZES = [10, 100, 1000, 10000, 100000, 1000000]
+
+# timings below this are too noisy to compare against a baseline, or to estimate the scaling exponent from
+MIN_SECONDS = 0.001
+
+
+def measure(function, repeat=3, min_total=0.1):
+    """
+    Time a function. It is called at least *repeat* times, and until *min_total* seconds are spent
+
+    :return: the fastest time in seconds
+    """
+    best = math.inf
+    total = 0.0
+    runs = 0
+    while runs < repeat or total < min_total:
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        runs += 1
+        if elapsed > min_total:
+            break
+    return best
+
+
+def exponent(timings):
+    """
+    Least squares slope of log(seconds) against log(size)
+
+    :param dict timings: size -> seconds
+    :return: the scaling exponent, or None if there are too few usable timings
+    """
+    points = [(math.log(size), math.log(seconds)) for size, seconds in timings.items() if seconds >= MIN_SECONDS]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+def run(sizes=None, name_filter=None, lengths=None, repeat=3, max_seconds=1.0, out=sys.stdout):
+    """
+    Run the benchmarks
+
+    :return: the results as a dict, see :func:`save`
+    """
+    results = {}
+    for name, _, length, ignore_case, build in cases(name_filter, lengths):
+        timings = {}
+        for size in sizes or SIZES:
+            seconds = measure(prepare(build, size, length, ignore_case), repeat)
+            timings[size] = seconds
+            print('%-45s %9d %12.6f s %14.0f values/s' % (name, size, seconds, size / seconds), file=out)
+            if seconds > max_seconds:
+                break
+        slope = exponent(timings)
+        results[name] = {'seconds': {str(size): seconds for size, seconds in timings.items()}, 'exponent': slope}
+        print('%-45s scaling exponent: %s' % (name, '-' if slope is None else '%.2f' % slope), file=out)
+    return results
+
+
+def save(results, filename):
+    """
+    Save the results as JSON, together with information about the platform
+    """
+    document = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(filename, 'w') as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+
+
+def compare(results, filename, tolerance=0.25, exponent_tolerance=0.3):
+    """
+    Compare the results with a saved baseline
+
+    :param float tolerance: allowed relative increase in time, e.g. 0.25 for 25%
+    :param float exponent_tolerance: allowed increase of the scaling exponent
+    :return: list of regression messages. Empty if nothing got slower
+    """
+    with open(filename) as file:
+        baseline = json.load(file)['results']
+
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        for size, seconds in result['seconds'].items():
+            old = baseline[name]['seconds'].get(size)
+            if old is None or max(old, seconds) < MIN_SECONDS:
+                continue
+            if seconds > old * (1 + tolerance):
+                regressions.append('%s size %s: %.6f s -> %.6f s (%+.0f%%)'
+                                   % (name, size, old, seconds, (seconds / old - 1) * 100))
+        old_exponent = baseline[name].get('exponent')
+        new_exponent = result.get('exponent')
+        if old_exponent is not None and new_exponent is not None and new_exponent > old_exponent + exponent_tolerance:
+            regressions.append('%s scaling exponent: %.2f -> %.2f' % (name, old_exponent, new_exponent))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Speed benchmarks for str_util')
+    parser.add_argument('--sizes', help='comma separated list sizes (default %s)' % ','.join(map(str, SIZES)))
+    parser.add_argument('--max-size', type=int, help='skip sizes larger than this')
+    parser.add_argument('--filter', help='only run cases where the name contains this string')
+    parser.add_argument('--lengths', help='comma separated value lengths: %s' % ','.join(LENGTHS))
+    parser.add_argument('--repeat', type=int, default=3, help='minimum number of runs per timing (default 3)')
+    parser.add_argument('--max-seconds', type=float, default=1.0,
+                        help='skip larger sizes when a run takes longer than this (default 1.0)')
+    parser.add_argument('--save', metavar='FILE', help='save the results as JSON')
+    parser.add_argument('--compare', metavar='FILE', help='compare with results saved by --save')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative slowdown when comparing (default 0.25)')
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else SIZES
+    if args.max_size:
+        sizes = [size for size in sizes if size <= args.max_size]
+    lengths = args.lengths.split(',') if args.lengths else None
+
+    results = run(sizes, args.filter, lengths, args.repeat, args.max_seconds)
+    if args.save:
+        save(results, args.save)
+    if args.compare:
+        regressions = compare(results, args.compare, args.tolerance)
+        for regression in regressions:
+            print('REGRESSION: ' + regression)
+        if regressions:
+            return 1
+        print('No regressions')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
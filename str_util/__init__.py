@@ -1,8 +1,57 @@
-import fnmatch  # used by the like function
-import re  # used by the replace_substring function
-
 name = "str_util"
 
+# Classes and functions from the submodules are imported when they are first used, so "import str_util" stays fast.
+# The functions below import what they need (re, fnmatch...) inside the function body for the same reason
+_LAZY = {
+    'Replacer': 'replacer',
+    'get_replacer': 'replacer',
+    'ReplaceMap': 'replace_map',
+    'KeywordMatcher': 'automaton',
+    'get_matcher': 'automaton',
+    'LikePattern': 'globbing',
+    'LikeSet': 'globbing',
+    'compile_like': 'globbing',
+    'iter_trim': 'streaming',
+    'iter_lowercase': 'streaming',
+    'iter_propercase': 'streaming',
+    'iter_left': 'streaming',
+    'iter_right': 'streaming',
+    'iter_word': 'streaming',
+    'iter_replace': 'streaming',
+    'iter_replace_substring': 'streaming',
+    'iter_like': 'streaming',
+    'iter_diff': 'streaming',
+    'iter_unique': 'streaming',
+    'Pipeline': 'pipeline',
+    'FoldedString': 'folded',
+    'FoldedList': 'folded',
+    'ListIndex': 'list_index',
+    'TokenizedText': 'tokenized',
+    'get_tokenized': 'tokenized',
+    'StringColumn': 'column',
+    'EncodedList': 'encoded',
+    'BloomFilter': 'bloom',
+    'MembershipFilter': 'bloom',
+}
+
+
+def __getattr__(attribute):
+    module = _LAZY.get(attribute)
+    if module is None:
+        raise AttributeError("module 'str_util' has no attribute '%s'" % attribute)
+    import importlib
+    value = getattr(importlib.import_module('str_util.' + module), attribute)
+    globals()[attribute] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# contains() and contains_all() use an Aho-Corasick automaton when searching for this many substrings or more
+_MATCHER_THRESHOLD = 200
+
 
 def to_string(value):
     """
@@ -34,6 +83,8 @@ def to_list(value):
     """
     if is_list(value):
         return value
+    if _is_native_list(value):
+        return value.to_list()
     return [value]
 
 
@@ -91,9 +142,11 @@ def trim(value):
     []
 
     """
-    if is_list(value):
-        trimmed = list(map(trim, value))  # trim all entries in list
-        return list(filter(lambda entry: entry != '', trimmed))  # remove empty entries
+    if not isinstance(value, str):
+        if is_list(value):
+            return [entry for entry in map(trim, value) if entry != '']  # trim all entries and remove empty entries
+        if _is_native_list(value):
+            return value.trim()
     return " ".join(value.split())  # trim string
 
 
@@ -115,15 +168,79 @@ def unique(source_list, ignore_case=False):
     ['red', 'green']
 
     """
+    if _is_native_list(source_list):
+        return source_list.unique(ignore_case)
     if ignore_case:
-        unique_list = []
+        unique_entries = {}
         for entry in source_list:
-            if not is_member(entry, unique_list, ignore_case=True):
-                unique_list.append(entry)
-        return unique_list
+            unique_entries.setdefault(entry.casefold(), entry)
+        return list(unique_entries.values())
     return list(dict.fromkeys(source_list))
 
 
+def unique_counts(values, ignore_case=False, top_k=None):
+    """
+    Count how many times each value occurs in a list. The list is scanned once
+
+    :param list values: Any text list
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    :param int top_k: Optional. Only return the *top_k* most frequent values (Default all values)
+    :return: (value, count) tuples, with the first occurrence of each value in the order they first occur.
+        With *top_k*, the most frequent values first. Values with the same count are kept in the order they
+        first occur
+    :rtype: list
+
+    >>> unique_counts( ['red','green','Red','green'])
+    [('red', 1), ('green', 2), ('Red', 1)]
+
+    >>> unique_counts( ['red','green','Red','green', 'blue'], ignore_case=True)
+    [('red', 2), ('green', 2), ('blue', 1)]
+
+    >>> unique_counts( ['a', 'b', 'c', 'b', 'c', 'c'], top_k=2)
+    [('c', 3), ('b', 2)]
+
+    """
+    if _is_native_list(values):
+        return values.unique_counts(ignore_case, top_k)
+    return _most_common(_count(to_list(values), ignore_case), top_k)
+
+
+def _count(values, ignore_case=False):
+    """
+    The (first occurrence, count) pairs of an iterable, in the order the values first occur
+
+    >>> _count(iter(['a', 'B', 'b']), ignore_case=True)
+    [('a', 1), ('B', 2)]
+    """
+    if not ignore_case:
+        from collections import Counter
+        return list(Counter(values).items())
+    counts = {}
+    first = {}
+    for entry in values:
+        key = entry.casefold()
+        if key in counts:
+            counts[key] += 1
+        else:
+            counts[key] = 1
+            first[key] = entry
+    return [(first[key], count) for key, count in counts.items()]
+
+
+def _most_common(pairs, top_k=None):
+    """
+    The *top_k* (value, count) pairs with the highest count, or all pairs if *top_k* is None.
+    Pairs with the same count keep their order
+
+    >>> _most_common([('a', 1), ('b', 2), ('c', 2)], 2)
+    [('b', 2), ('c', 2)]
+    """
+    if top_k is None:
+        return pairs
+    import heapq
+    return heapq.nlargest(top_k, pairs, key=lambda pair: pair[1])
+
+
 def is_empty(value):
     """
     Return true is value is empty or only contains whitespace
@@ -170,13 +287,15 @@ def contains(value, substrings, ignore_case=False):
     True
 
     """
-    if is_list(value):
-        return any([contains(entry, substrings, ignore_case) for entry in value])
-
+    if _is_native_list(value):
+        return value.contains(substrings, ignore_case)
     substrings = to_list(substrings)
-    if ignore_case:
-        return any([entry.casefold() in value.casefold() for entry in substrings])
-    return any([entry in value for entry in substrings])
+    if len(substrings) >= _MATCHER_THRESHOLD:
+        from str_util.automaton import get_matcher
+        return get_matcher(substrings, ignore_case).contains(value)
+
+    keys = [_key(entry, ignore_case) for entry in substrings]
+    return any(any(key in text for key in keys) for text in _keys(value, ignore_case))
 
 
 def contains_all(value, substrings, ignore_case=False):
@@ -203,13 +322,15 @@ def contains_all(value, substrings, ignore_case=False):
     True
 
     """
-    if is_list(value):
-        return any([contains_all(entry, substrings, ignore_case) for entry in value])
-
+    if _is_native_list(value):
+        return value.contains_all(substrings, ignore_case)
     substrings = to_list(substrings)
-    if ignore_case:
-        return all([entry.casefold() in value.casefold() for entry in substrings])
-    return all([entry in value for entry in substrings])
+    if len(substrings) >= _MATCHER_THRESHOLD:
+        from str_util.automaton import get_matcher
+        return get_matcher(substrings, ignore_case).contains_all(value)
+
+    keys = [_key(entry, ignore_case) for entry in substrings]
+    return any(all(key in text for key in keys) for text in _keys(value, ignore_case))
 
 
 def index_of(value, substring, ignore_case=False, reverse=False):
@@ -247,17 +368,77 @@ def index_of(value, substring, ignore_case=False, reverse=False):
 
     """
     if is_list(value):
+        if not is_string(substring):
+            return next((i for i, entry in enumerate(value) if is_equal(entry, substring, ignore_case)), -1)
+        key = _key(substring, ignore_case)
         for i, entry in enumerate(value):
-            if is_equal(entry, substring, ignore_case):
+            if _key(entry, ignore_case) == key:
                 return i
         return -1
 
+    positions = None
+    if ignore_case:
+        value, positions = _casefold_positions(value)
+        substring = substring.casefold()
+    position = value.rfind(substring) if reverse else value.find(substring)
+    if positions is None or position < 0:
+        return position
+    return positions[position]
+
+
+def find_all(value, substring, ignore_case=False, overlapping=False):
+    """
+    Find all occurrences of the substring. The string is scanned once from left to right, without slicing the
+    rest of the string after each match
+
+    :param str,list value: the source to search in
+    :param str substring: the substring to search for in the source value
+    :param bool ignore_case: Optional. Specify True to perform a case-insensitive search (default False)
+    :param bool overlapping: Optional. Specify True to also find occurrences overlapping the previous one
+        (default False)
+    :return: generator with the position of each occurrence. For a list, (element index, position) tuples
+
+    >>> list(find_all('Like: I like that you like me', 'like'))
+    [8, 22]
+
+    >>> list(find_all('aaaa', 'aa')), list(find_all('aaaa', 'aa', overlapping=True))
+    ([0, 2], [0, 1, 2])
+
+    >>> list(find_all(['Red', 'Green', 'Blue'], 'E', ignore_case=True))
+    [(0, 1), (1, 2), (1, 3), (2, 3)]
+
+    The positions are positions in the original string, also when casefolding changes the length
+
+    >>> list(find_all('Straße, STRASSE', 'strasse', ignore_case=True))
+    [0, 8]
+
+    """
+    if is_list(value):
+        for i, entry in enumerate(value):
+            for position in find_all(entry, substring, ignore_case, overlapping):
+                yield i, position
+        return
+
+    positions = None
     if ignore_case:
-        value = value.casefold()
+        value, positions = _casefold_positions(value)
         substring = substring.casefold()
-    if reverse:
-        return value.rfind(substring)
-    return value.find(substring)
+    step = 1 if overlapping else max(len(substring), 1)
+    find = value.find
+    position = find(substring)
+    if positions is None:
+        while position >= 0:
+            yield position
+            position = find(substring, position + step)
+        return
+
+    previous = -1
+    while position >= 0:
+        # several casefolded characters may come from the same original character
+        if positions[position] != previous:
+            previous = positions[position]
+            yield previous
+        position = find(substring, position + step)
 
 
 def implode(strings, separator=''):
@@ -297,8 +478,11 @@ def propercase(value):
     ['Blue', 'Red', 'Very Green']
 
     """
-    if is_list(value):
-        return [propercase(entry) for entry in value]
+    if not isinstance(value, str):
+        if is_list(value):
+            return [propercase(entry) for entry in value]
+        if _is_native_list(value):
+            return value.propercase()
     return implode([entry.capitalize() for entry in value.split()], ' ')
 
 
@@ -349,8 +533,11 @@ def left(value, find, ignore_case=False):
     ['Ja', 'Ma']
 
     """
-    if is_list(value):
-        return [left(entry, find) for entry in value]
+    if not isinstance(value, str):
+        if is_list(value):
+            return [left(entry, find) for entry in value]
+        if _is_native_list(value):
+            return value.left(find, ignore_case)
 
     if isinstance(find, int):
         if find > 0:
@@ -403,8 +590,11 @@ def left_back(value, find, ignore_case=False):
     'Hello Wor'
 
     """
-    if is_list(value):
-        return [left_back(entry, find) for entry in value]
+    if not isinstance(value, str):
+        if is_list(value):
+            return [left_back(entry, find) for entry in value]
+        if _is_native_list(value):
+            return value.left_back(find, ignore_case)
 
     if isinstance(find, int):
         if find > 0:
@@ -436,13 +626,145 @@ def is_member(source_list, search_list, ignore_case=False):
     >>> is_member( ['Jakob','Maiken'], ['Maiken','Amalie','Jakob','Ida'])
     True
 
+    >>> is_member( ['jakob','IDA'], ['Maiken','Amalie','Jakob','Ida'], ignore_case=True)
+    True
+
+    To compare with the same large list many times, pass a :class:`~str_util.bloom.MembershipFilter` or
+    a :class:`~str_util.list_index.ListIndex` as *search_list*. It must be built with the same *ignore_case*,
+    otherwise ValueError is raised
+
+    """
+    lookup = _lookup_set(search_list, ignore_case)
+    return all(_key(entry, ignore_case) in lookup for entry in to_list(source_list))
+
+
+def _key(value, ignore_case=False):
+    """
+    The key used when comparing values in the set based list functions
+
+    :param str value: the value
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    :return: the value, casefolded if *ignore_case* is true
+
+    >>> _key('Der Fluß', ignore_case=True)
+    'der fluss'
     """
-    search_list = to_list(search_list)
-    if is_list(source_list):
-        return all([is_member(entry, search_list, ignore_case) for entry in source_list])
     if ignore_case:
-        return is_member(lowercase(source_list), lowercase(search_list))
-    return source_list in search_list
+        return value.casefold()
+    return value
+
+
+def _keys(values, ignore_case=False):
+    """
+    Generator with the key of each value in a string or list
+
+    >>> list(_keys(['Red', 'GREEN'], ignore_case=True))
+    ['red', 'green']
+    """
+    return (_key(entry, ignore_case) for entry in to_list(values))
+
+
+def _lookup_set(values, ignore_case=False):
+    """
+    Build a set for fast membership tests. Each value is casefolded once when *ignore_case* is true
+
+    :type values: list or str
+    :param values: the values to put in the set
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    :return: set with the (casefolded) values
+    :rtype: set
+
+    >>> sorted(_lookup_set(['Red', 'RED', 'green'], ignore_case=True))
+    ['green', 'red']
+
+    A prebuilt :class:`_Lookup` is used as it is. It must be built with the same *ignore_case*, otherwise
+    ValueError is raised
+    """
+    if isinstance(values, _Lookup):
+        if bool(ignore_case) != bool(values.ignore_case):
+            raise ValueError('ignore_case=%r requires a %s built with ignore_case=%r'
+                             % (bool(ignore_case), type(values).__name__, bool(ignore_case)))
+        return values
+    return set(_keys(values, ignore_case))
+
+
+class _Lookup:
+    """
+    Base class of the prebuilt lookups, :class:`~str_util.list_index.ListIndex` and
+    :class:`~str_util.bloom.MembershipFilter`. They can be passed instead of the list to search in to
+    :func:`is_member`, :func:`diff` and :func:`intersection`, when it is built with the same *ignore_case* as the
+    function is called with. A lookup has an *ignore_case* attribute, and ``value in lookup`` ignores case
+    when it is set
+    """
+    __slots__ = ()
+
+
+class _NativeList:
+    """
+    Base class of the list types which the str_util functions accept and return as they are, instead of converting
+    them to a list: :class:`~str_util.column.StringColumn` and :class:`~str_util.encoded.EncodedList`.
+    A native list implements the functions as methods with the same name, without the first argument
+    """
+    __slots__ = ()
+
+
+def _is_native_list(value):
+    """
+    Check if the value is a :class:`_NativeList`
+
+    >>> _is_native_list(['a'])
+    False
+    """
+    return isinstance(value, _NativeList)
+
+
+def _casefold_positions(value):
+    """
+    Casefold a string, and keep track of the original position of each character.
+    Casefolding may change the length of the string (ß -> ss), so positions found in the casefolded string
+    can't be used in the original string
+
+    :param str value: the string
+    :return: (casefolded string, list with the position in *value* of each character in the casefolded string,
+        followed by the length of *value*). The list is None if the length didn't change, i.e. the positions are
+        the same
+
+    >>> _casefold_positions('Fluß!')
+    ('fluss!', [0, 1, 2, 3, 3, 4, 5])
+    >>> _casefold_positions('ABC')
+    ('abc', None)
+    """
+    folded = value.casefold()
+    if len(folded) == len(value):
+        return folded, None
+    positions = []
+    for position, char in enumerate(value):
+        positions.extend([position] * len(char.casefold()))
+    positions.append(len(value))
+    return folded, positions
+
+
+def _match_end(value, find, ignore_case=False, reverse=False):
+    """
+    The position in *value* just after the first (or last) occurrence of *find*, or -1 if not found.
+    With ignore_case, the end of the match is mapped back to *value*, like the start is in :func:`index_of`
+
+    >>> _match_end('Straße ist gut', 'STRASSE', ignore_case=True)
+    6
+    """
+    positions = None
+    if ignore_case:
+        value, positions = _casefold_positions(value)
+        find = find.casefold()
+    position = value.rfind(find) if reverse else value.find(find)
+    if position < 0:
+        return -1
+    if positions is None:
+        return position + len(find)
+    if not find:
+        return positions[position]
+    # the position after the original character holding the last matched character
+    return positions[position + len(find) - 1] + 1
 
 
 def lowercase(value):
@@ -464,6 +786,8 @@ def lowercase(value):
     """
     if is_list(value):
         return [entry.casefold() for entry in value]
+    if _is_native_list(value):
+        return value.lowercase()
     return value.casefold()
 
 
@@ -513,8 +837,11 @@ def right(value, find, ignore_case=False):
     ['', 'kilde']
 
     """
-    if is_list(value):
-        return [right(entry, find) for entry in value]
+    if not isinstance(value, str):
+        if is_list(value):
+            return [right(entry, find) for entry in value]
+        if _is_native_list(value):
+            return value.right(find, ignore_case)
 
     if isinstance(find, int):
         if find > len(value):
@@ -522,9 +849,9 @@ def right(value, find, ignore_case=False):
         if find > 0:
             return value[find:]
         return value[find:]
-    pos = index_of(value, find, ignore_case)
-    if pos >= 0:
-        return right(value, pos + len(find))
+    end = _match_end(value, find, ignore_case)
+    if end >= 0:
+        return right(value, end)
     return ""
 
 
@@ -573,8 +900,11 @@ def right_back(value, find, ignore_case=False):
 
 
     """
-    if is_list(value):
-        return [right_back(entry, find) for entry in value]
+    if not isinstance(value, str):
+        if is_list(value):
+            return [right_back(entry, find) for entry in value]
+        if _is_native_list(value):
+            return value.right_back(find, ignore_case)
 
     if isinstance(find, int):
         if find > len(value):
@@ -582,9 +912,9 @@ def right_back(value, find, ignore_case=False):
         if find > 0:
             return value[-find:]
         return value
-    pos = index_of(value, find, ignore_case, reverse=True)
-    if pos >= 0:
-        return right(value, pos + len(find))
+    end = _match_end(value, find, ignore_case, reverse=True)
+    if end >= 0:
+        return right(value, end)
     return ""
 
 
@@ -627,12 +957,98 @@ def word(value, number, separator=None):
     >>> word( ["North, West, East", 'Scandinavia, UK, China'], 2, ", ")
     ['West', 'UK']
 
+    The string is only split up to the requested word, from the right for negative numbers. Use :func:`words`
+    to get several words from the same string
+
+    """
+    if not isinstance(value, str):
+        if is_list(value):
+            return [word(entry, number, separator) for entry in value]
+        if _is_native_list(value):
+            return value.word(number, separator)
+    if number < 0:
+        tokens = value.rsplit(separator, -number)
+    else:
+        tokens = value.split(separator, max(number, 1))
+    return _word_at(tokens, number)
+
+
+def words(value, numbers, separator=None):
+    """
+    Returns several words from a text string, see :func:`word`. The string is split once,
+    and only as far as needed for the requested words
+
+    :type value: str or list
+    :param value: the sentence to be scanned
+    :param list numbers: positions of the words you want returned. 1 is the first word in the sentence
+        and -1 is the last word
+    :param separator: Optional (default is any whitespace)
+    :return: the selected words. For a list, a list of words for each element
+    :rtype: list
+
+    >>> words( "Jakob Majkilde, Denmark", [1, 2, -1])
+    ['Jakob', 'Majkilde,', 'Denmark']
+
+    >>> words( ["North, West, East", 'Scandinavia, UK'], [1, 3], ", ")
+    [['North', 'East'], ['Scandinavia', '']]
+
     """
+    numbers = to_list(numbers)
     if is_list(value):
-        return [word(entry, number, separator) for entry in value]
-    tokens = value.split(separator)
+        return [words(entry, numbers, separator) for entry in value]
+    if not numbers:
+        return []
+    if max(numbers) < 0:
+        tokens = value.rsplit(separator, -min(numbers))
+    elif min(numbers) >= 0:
+        tokens = value.split(separator, max(max(numbers), 1))
+    else:
+        tokens = value.split(separator)
+    return [_word_at(tokens, number) for number in numbers]
+
+
+def split_columns(lines, separator=None, columns=None):
+    """
+    Split a list of delimited strings into columns. Each line is split once, so getting k columns
+    is one pass over the list instead of k calls to :func:`word`
+
+    :type lines: list or str
+    :param lines: the lines to split
+    :param separator: Optional (default is any whitespace)
+    :param list columns: Optional. Positions of the columns you want returned, like the *number* in :func:`word`.
+        1 is the first column and -1 is the last column. Default is all columns
+    :return: a list for each column, with one value per line. Missing fields are returned as ''
+    :rtype: list
+
+    >>> split_columns(['Jakob, Majkilde, Denmark', 'Anna, Smith'], ', ')
+    [['Jakob', 'Anna'], ['Majkilde', 'Smith'], ['Denmark', '']]
+
+    >>> split_columns(['Jakob, Majkilde, Denmark', 'Anna, Smith'], ', ', columns=[1, -1])
+    [['Jakob', 'Anna'], ['Denmark', 'Smith']]
+
+    """
+    lines = to_list(lines)
+    if columns is None:
+        rows = [line.split(separator) for line in lines]
+        width = max(map(len, rows)) if rows else 0
+        return [[row[i] if i < len(row) else '' for row in rows] for i in range(width)]
+
+    columns = to_list(columns)
+    if not lines:
+        return [[] for _ in columns]
+    return [list(column) for column in zip(*words(lines, columns, separator))]
+
+
+def _word_at(tokens, number):
+    """
+    Return word *number* from a list of words, or '' if there is no such word.
+    Number 1 is the first word and -1 is the last word
+
+    >>> _word_at(['a', 'b'], 2), _word_at(['a', 'b'], -3)
+    ('b', '')
+    """
     index = number - 1 if number > 0 else number
-    if index >= len(tokens):
+    if index >= len(tokens) or index < -len(tokens):
         return ''
     return tokens[index]
 
@@ -666,12 +1082,36 @@ def is_equal(value1, value2, ignore_case=False):
     >>> is_equal(['b','c'], ['c','b','a'])
     False
 
+    Duplicates must occur the same number of times in both lists
+
+    >>> is_equal(['a','a','b'], ['a','b','b'])
+    False
+
 
     """
+    if is_string(value1) and is_string(value2):
+        return _key(value1, ignore_case) == _key(value2, ignore_case)
+
     list1 = to_list(value1)
     list2 = to_list(value2)
-    cmp = intersection(list1, list2, ignore_case)
-    return len(cmp) == len(list1) == len(list2)
+    if len(list1) != len(list2):
+        return False
+
+    if ignore_case:
+        list1 = lowercase(list1)
+        list2 = lowercase(list2)
+
+    # count the members of list1, and check that list2 has the same members the same number of times
+    counts = {}
+    get_count = counts.get
+    for key in list1:
+        counts[key] = get_count(key, 0) + 1
+    for key in list2:
+        count = get_count(key, 0)
+        if not count:
+            return False
+        counts[key] = count - 1
+    return True
 
 
 def compare(string1, string2, ignore_case=False):
@@ -709,38 +1149,6 @@ def compare(string1, string2, ignore_case=False):
     return 0
 
 
-def _replace_str(string, fromlist, tolist, ignore_case=False):
-    """
-    if string is found in fromlist then replace with the corresponding value in tolist
-
-    :param string: the source string to be replaced
-    :param fromlist: the list to search in
-    :param tolist: the list of strings to replace with
-    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
-    :return: replaced value
-    :rtype: str
-
-    >>> _replace_str( 'HELLO', ['Hej', 'Hi', 'Hello'], ['Greeting'], ignore_case=True)
-    'Greeting'
-
-    >>> _replace_str( 'Apple', 'Microsoft', 'IBM')
-    'Apple'
-
-    >>> _replace_str( 'Apple', 'Apple', 'IBM')
-    'IBM'
-
-
-    """
-    fromlist = to_list(fromlist)
-    tolist = to_list(tolist)
-    idx = index_of(fromlist, string, ignore_case)
-    if idx >= 0:
-        if idx >= len(tolist):
-            return tolist[-1]
-        return tolist[idx]
-    return string
-
-
 def replace(source, fromlist, tolist, ignore_case=False):
     """
     Performs a search-and-replace operation on a list.
@@ -764,10 +1172,13 @@ def replace(source, fromlist, tolist, ignore_case=False):
     >>> replace( ['red', 'yellow', 'green', 'blue'], ['red', 'green', 'blue'], ['purple', 'silver'] )
     ['purple', 'yellow', 'silver', 'silver']
 
-    """
-    source = to_list(source)
+    To replace with the same mapping many times, build a :class:`~str_util.replace_map.ReplaceMap` once and reuse it
 
-    return [_replace_str(entry, fromlist, tolist, ignore_case) for entry in source]
+    """
+    if _is_native_list(source):
+        return source.replace(fromlist, tolist, ignore_case)
+    from str_util.replace_map import ReplaceMap
+    return ReplaceMap(fromlist, tolist, ignore_case).replace(source)
 
 
 def _make_equal_length(list1, list2):
@@ -788,14 +1199,8 @@ def _make_equal_length(list1, list2):
     """
     list1 = to_list(list1)
     list2 = to_list(list2)
-
-    while len(list1) < len(list2):
-        list1.append(list1[-1])
-
-    while len(list2) < len(list1):
-        list2.append(list2[-1])
-
-    return list1, list2
+    size = max(len(list1), len(list2))
+    return list1 + list1[-1:] * (size - len(list1)), list2 + list2[-1:] * (size - len(list2))
 
 
 def replace_substring(source, fromlist, tolist, ignore_case=False):
@@ -830,18 +1235,17 @@ def replace_substring(source, fromlist, tolist, ignore_case=False):
     >>> replace_substring( "I like apples", ["like", "apples"], ["hate", "peaches"])
     'I hate peaches'
 
+    All words are replaced in a single pass, using a cached :class:`~str_util.replacer.Replacer`
 
-    """
-    if is_list(source):
-        return [replace_substring(entry, fromlist, tolist, ignore_case) for entry in source]
+    >>> replace_substring( "a < b", ["<", "&"], ["&lt;", "&amp;"])
+    'a &lt; b'
 
-    fromlist, tolist = _make_equal_length(fromlist, tolist)
 
-    options = '(?i)' if ignore_case else ''
-
-    for i, from_str in enumerate(fromlist):
-        source = re.sub(options + re.escape(from_str), lambda m: tolist[i], source)
-    return source
+    """
+    if _is_native_list(source):
+        return source.replace_substring(fromlist, tolist, ignore_case)
+    from str_util.replacer import get_replacer
+    return get_replacer(fromlist, tolist, ignore_case).replace(source)
 
 
 def diff(list1, list2, ignore_case=False):
@@ -867,10 +1271,13 @@ def diff(list1, list2, ignore_case=False):
     >>> diff( ['A','B','C'], ['A','D', 'c'], ignore_case=True)
     ['B']
 
+    To compare with the same large list many times, pass a :class:`~str_util.bloom.MembershipFilter` or
+    a :class:`~str_util.list_index.ListIndex` as *list2*. It must be built with the same *ignore_case*,
+    otherwise ValueError is raised
+
     """
-    list1 = to_list(list1)
-    list2 = to_list(list2)
-    return [entry for entry in list1 if not is_member(entry, list2, ignore_case)]
+    lookup = _lookup_set(list2, ignore_case)
+    return [entry for entry in to_list(list1) if _key(entry, ignore_case) not in lookup]
 
 
 def union(list1, list2):
@@ -917,10 +1324,13 @@ def intersection(list1, list2, ignore_case=False):
     >>> intersection("Der Fluß", "DER fluss", ignore_case=True)
     ['Der Fluß']
 
+    To compare with the same large list many times, pass a :class:`~str_util.bloom.MembershipFilter` or
+    a :class:`~str_util.list_index.ListIndex` as *list2*. It must be built with the same *ignore_case*,
+    otherwise ValueError is raised
+
     """
-    list1 = to_list(list1)
-    list2 = to_list(list2)
-    return [entry for entry in list1 if is_member(entry, list2, ignore_case)]
+    lookup = _lookup_set(list2, ignore_case)
+    return [entry for entry in to_list(list1) if _key(entry, ignore_case) in lookup]
 
 
 def like(string, pattern, ignore_case=False):
@@ -944,12 +1354,13 @@ def like(string, pattern, ignore_case=False):
     >>> like( ['Petersen','Pedersen','Peter', 'Olsen'],"Pe?er*" )
     [True, True, True, False]
 
+    To test many values with the same pattern, use :func:`~str_util.globbing.compile_like`
+
     """
-    if is_list(string):
-        return [like(entry, pattern, ignore_case) for entry in string]
-    if ignore_case:
-        return fnmatch.fnmatch(string, pattern)
-    return fnmatch.fnmatchcase(string, pattern)
+    if _is_native_list(string):
+        return string.like(pattern, ignore_case)
+    from str_util.globbing import compile_like
+    return compile_like(pattern, ignore_case).match(string)
 
 
 def sort(source_list, ignore_case=False, reverse=False):
@@ -969,11 +1380,9 @@ def sort(source_list, ignore_case=False, reverse=False):
 
 
     """
-    sorted_list = source_list.copy()
-
+    if _is_native_list(source_list):
+        return source_list.sort(ignore_case, reverse)
     if ignore_case:
-        sorted_list.sort(key=lambda s: s.casefold(), reverse=reverse)
-    else:
-        sorted_list.sort(reverse=reverse)
+        return sorted(source_list, key=lambda entry: entry.casefold(), reverse=reverse)
+    return sorted(source_list, reverse=reverse)
 
-    return sorted_list
@@ -0,0 +1,172 @@
+import collections
+import functools
+
+from str_util import is_list, to_list, _casefold_positions, _key
+
+
+class KeywordMatcher:
+    """
+    Searches for many substrings at once, using an `Aho-Corasick <https://en.wikipedia.org/wiki/Aho–Corasick_algorithm>`_
+    automaton. The text is scanned once, no matter how many substrings you search for.
+
+    :func:`~str_util.contains` and :func:`~str_util.contains_all` use a cached matcher when they are called with
+    a long list of substrings.
+
+    :type substrings: list or str
+    :param substrings: The string(s) you want to search for
+    :param bool ignore_case: Optional. Specify True to perform a case-insensitive search (default False)
+
+    >>> matcher = KeywordMatcher(['he', 'she', 'his', 'hers'])
+    >>> matcher.contains('ushers')
+    True
+
+    >>> list(matcher.matches('ushers'))
+    [(1, 'she'), (2, 'he'), (2, 'hers')]
+
+    >>> KeywordMatcher(['red', 'BLUE'], ignore_case=True).keywords('Blue, blue and Red')
+    ['BLUE', 'red']
+
+    """
+
+    def __init__(self, substrings, ignore_case=False):
+        self.substrings = to_list(substrings)
+        self.ignore_case = ignore_case
+
+        # first original substring for each distinct (casefolded) search key
+        self._keywords = {}
+        for entry in self.substrings:
+            self._keywords.setdefault(_key(entry, ignore_case), entry)
+        self._has_empty = '' in self._keywords
+        self._keys = [key for key in self._keywords if key]
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        for key in self._keys:
+            self._add(key)
+        self._link()
+
+    def _add(self, key):
+        state = 0
+        for char in key:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._output[state] = (key,)
+
+    def _link(self):
+        goto, fail, output = self._goto, self._fail, self._output
+        queue = collections.deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                output[next_state] = output[next_state] + output[fail[next_state]]
+
+    def _scan(self, text):
+        """
+        Yields (end position, keys) for every position in the text where one or more keys end
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for pos, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                yield pos, output[state]
+
+    def contains(self, value):
+        """
+        Determine if a string contains any of the substrings
+
+        :param value: (str or list) The string you want to search in
+        :return: True if any substring is found. Like :func:`~str_util.contains`, a blank substring is always found
+        :rtype: bool
+        """
+        if is_list(value):
+            return any(self.contains(entry) for entry in value)
+        if self._has_empty:
+            return True
+        for _ in self._scan(_key(value, self.ignore_case)):
+            return True
+        return False
+
+    def contains_all(self, value):
+        """
+        Determine if a string contains all of the substrings
+
+        :param value: (str or list) The string you want to search in. For a list, at least one entry must contain
+            all substrings
+        :return: True if all substrings is found
+        :rtype: bool
+        """
+        if is_list(value):
+            return any(self.contains_all(entry) for entry in value)
+        missing = set(self._keys)
+        if not missing:
+            return True
+        for _, keys in self._scan(_key(value, self.ignore_case)):
+            missing.difference_update(keys)
+            if not missing:
+                return True
+        return False
+
+    def matches(self, value):
+        """
+        Find all occurrences of the substrings, including overlapping ones. Blank substrings are not reported
+
+        :param str value: The string you want to search in
+        :return: generator of (position, substring) tuples, ordered by the position where the match ends.
+            The positions are always positions in *value*, also when ignoring case
+        """
+        positions = None
+        text = value
+        if self.ignore_case:
+            text, positions = _casefold_positions(value)
+
+        for end, keys in self._scan(text):
+            for key in keys:
+                start = end - len(key) + 1
+                if positions is not None:
+                    start = positions[start]
+                yield start, self._keywords[key]
+
+    def keywords(self, value):
+        """
+        Return the substrings found in a string or list
+
+        :param value: (str or list) The string you want to search in
+        :return: the substrings found, in the order they are first found
+        :rtype: list
+        """
+        found = {}
+        for entry in to_list(value):
+            for _, keys in self._scan(_key(entry, self.ignore_case)):
+                for key in keys:
+                    found.setdefault(key)
+        return [self._keywords[key] for key in found]
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_matcher(substrings, ignore_case):
+    return KeywordMatcher(list(substrings), ignore_case)
+
+
+def get_matcher(substrings, ignore_case=False):
+    """
+    Return a :class:`KeywordMatcher` for the substrings. Recently used matchers are cached and reused
+
+    >>> get_matcher(['a', 'b']) is get_matcher(['a', 'b'])
+    True
+    """
+    return _cached_matcher(tuple(to_list(substrings)), ignore_case)
@@ -0,0 +1,269 @@
+"""
+A `Bloom filter <https://en.wikipedia.org/wiki/Bloom_filter>`_: a compact bit array that tells if a string
+has (probably) been added. It never misses a string that has been added, but may report a string
+that hasn't been added. How often that happens is set by the *error_rate*.
+
+>>> seen = BloomFilter(1000, error_rate=0.01)
+>>> seen.add('Red')
+True
+>>> seen.add('Red')
+False
+>>> 'Red' in seen, 'Blue' in seen
+(True, False)
+
+A :class:`MembershipFilter` uses a Bloom filter to reject most values which are not in a large reference list,
+before checking the values exactly.
+
+"""
+import hashlib
+import itertools
+import math
+import mmap
+import struct
+import sys
+from array import array
+
+from str_util import _key, _keys, _Lookup
+
+
+class BloomFilter:
+    """
+    A Bloom filter for strings. The strings are hashed with BLAKE2, so the bits are the same in all processes
+
+    :param int capacity: the expected number of strings. Adding more strings makes false positives more likely
+    :param float error_rate: Optional. The rate of false positives when the filter holds *capacity* strings
+        (default 0.01)
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be between 0 and 1')
+        capacity = max(capacity, 1)
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    @property
+    def nbytes(self):
+        """
+        The size of the bit array in bytes
+        """
+        return len(self._bits)
+
+    def _positions(self, value):
+        """
+        The bit positions of a string, using double hashing of a 128 bit digest
+        """
+        digest = hashlib.blake2b(value.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        return [(first + i * second) % size for i in range(self.hash_count)]
+
+    def __contains__(self, value):
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    def __len__(self):
+        """
+        The number of strings added, not counting the ones which were (probably) added before
+        """
+        return self.count
+
+    def add(self, value):
+        """
+        Add a string to the filter
+
+        :param str value: the string
+        :return: True if the string was not in the filter. False if it was (probably) added before
+        :rtype: bool
+        """
+        bits = self._bits
+        new = False
+        for position in self._positions(value):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+
+_MAGIC = b'STRBLOOM'
+# bloom size, hash count, bloom count, flags, number of keys, length of the keys in bytes
+_HEADER = struct.Struct('<QQQQQQ')
+_IGNORE_CASE = 1
+_EXACT = 2
+
+
+def _padding(length):
+    return -length % 8
+
+
+class MembershipFilter(_Lookup):
+    """
+    A lookup in a large reference list, like an allow list or a block list. Values are first tested with a
+    :class:`BloomFilter`, which rejects most values that are not in the list without looking at the list.
+    The remaining values are checked exactly with a binary search in the sorted, UTF-8 encoded reference values.
+
+    Pass it instead of the reference list to :func:`~str_util.is_member`, :func:`~str_util.diff`
+    and :func:`~str_util.intersection`, with the same *ignore_case* as the filter. The filter can be saved
+    to a file, and memory-mapped when loaded, so it is not read into memory.
+
+    :type reference: list or str
+    :param reference: the reference list
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    :param float error_rate: Optional. The rate of values not in the list which pass the Bloom filter
+        (default 0.01)
+    :param bool exact: Optional. Specify False to only keep the Bloom filter. Values not in the reference list
+        are then reported as members at the *error_rate* (default True)
+
+    >>> from str_util import diff
+    >>> blocked = MembershipFilter(['Spam', 'Scam'], ignore_case=True)
+    >>> 'SPAM' in blocked, 'Ham' in blocked
+    (True, False)
+    >>> diff(['ham', 'spam', 'eggs'], blocked, ignore_case=True)
+    ['ham', 'eggs']
+
+    """
+
+    def __init__(self, reference=(), ignore_case=False, error_rate=0.01, exact=True):
+        self.ignore_case = ignore_case
+        keys = set(_keys(reference, ignore_case))
+        self._bloom = BloomFilter(len(keys), error_rate)
+        for key in keys:
+            self._bloom.add(key)
+        self._keys = None
+        self._offsets = None
+        if exact:
+            encoded = sorted(key.encode('utf-8', 'surrogatepass') for key in keys)
+            self._keys = b''.join(encoded)
+            self._offsets = array('q', itertools.chain([0], itertools.accumulate(map(len, encoded))))
+        self._count = len(keys)
+
+    @property
+    def exact(self):
+        """
+        True if the reference values are kept, and members are checked exactly
+        """
+        return self._offsets is not None
+
+    def __len__(self):
+        """
+        The number of distinct (casefolded) reference values
+        """
+        return self._count
+
+    def __contains__(self, value):
+        key = _key(value, self.ignore_case)
+        if key not in self._bloom:
+            return False
+        if self._offsets is None:
+            return True
+        return self._find(key.encode('utf-8', 'surrogatepass'))
+
+    def _find(self, encoded):
+        """
+        Binary search for the encoded key. UTF-8 bytes sort in the same order as the strings
+        """
+        keys = self._keys
+        offsets = self._offsets
+        low = 0
+        high = len(offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if keys[offsets[middle]:offsets[middle + 1]] < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return low < len(offsets) - 1 and keys[offsets[low]:offsets[low + 1]] == encoded
+
+    def save(self, file):
+        """
+        Save the filter in a binary file
+
+        :param file: a file name, or a file opened in binary mode
+        """
+        if isinstance(file, str):
+            with open(file, 'wb') as opened:
+                return self.save(opened)
+        bloom = self._bloom
+        flags = (_IGNORE_CASE if self.ignore_case else 0) | (_EXACT if self.exact else 0)
+        file.write(_MAGIC)
+        file.write(_HEADER.pack(bloom.size, bloom.hash_count, bloom.count, flags, self._count,
+                                len(self._keys) if self.exact else 0))
+        file.write(bloom._bits)
+        file.write(bytes(_padding(len(bloom._bits))))
+        if self.exact:
+            offsets = array('q', self._offsets)
+            if sys.byteorder != 'little':
+                offsets.byteswap()
+            file.write(offsets.tobytes())
+            file.write(self._keys)
+
+    @classmethod
+    def load(cls, file, memory_map=True):
+        """
+        Load a filter saved by :meth:`save`
+
+        :param file: a file name, or a file opened in binary mode
+        :param bool memory_map: Optional. Specify False to read the file into memory, instead of memory-mapping it.
+            Only real files can be memory-mapped (default True)
+        :rtype: MembershipFilter
+        """
+        if isinstance(file, str):
+            with open(file, 'rb') as opened:
+                return cls.load(opened, memory_map)
+        if memory_map:
+            # the mapping stays valid when the file is closed
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = file.read()
+        view = memoryview(buffer)
+        if bytes(view[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError('Not a MembershipFilter file')
+        position = len(_MAGIC)
+        size, hash_count, bloom_count, flags, count, keys_length = _HEADER.unpack_from(buffer, position)
+        position += _HEADER.size
+
+        loaded = cls.__new__(cls)
+        loaded.ignore_case = bool(flags & _IGNORE_CASE)
+        loaded._count = count
+        bloom = loaded._bloom = BloomFilter.__new__(BloomFilter)
+        bloom.size = size
+        bloom.hash_count = hash_count
+        bloom.count = bloom_count
+        bits_length = (size + 7) // 8
+        bloom._bits = view[position:position + bits_length]
+        position += bits_length + _padding(bits_length)
+
+        loaded._keys = None
+        loaded._offsets = None
+        if flags & _EXACT:
+            offsets = view[position:position + (count + 1) * 8]
+            position += len(offsets)
+            if sys.byteorder == 'little':
+                loaded._offsets = offsets.cast('q')
+            else:
+                loaded._offsets = array('q', offsets.tobytes())
+                loaded._offsets.byteswap()
+            if len(buffer) < position + keys_length:
+                raise ValueError('The MembershipFilter file is truncated')
+            loaded._keys = _Slice(buffer, position)
+        return loaded
+
+
+class _Slice:
+    """
+    The part of a buffer (a memory-mapped file or bytes) starting at *start*. Slicing returns bytes,
+    without copying the rest of the buffer
+    """
+
+    def __init__(self, buffer, start):
+        self._buffer = buffer
+        self._start = start
+
+    def __getitem__(self, index):
+        return self._buffer[self._start + index.start:self._start + index.stop]
@@ -0,0 +1,347 @@
+"""
+A compact column of strings, stored as one UTF-8 buffer and an array with the offset of each string.
+A Python list of short strings costs 50+ bytes per string, a :class:`StringColumn` costs the UTF-8 bytes
+and 8 bytes for the offset.
+
+:func:`~str_util.trim`, :func:`~str_util.lowercase`, :func:`~str_util.propercase`, :func:`~str_util.left`,
+:func:`~str_util.left_back`, :func:`~str_util.right`, :func:`~str_util.right_back`, :func:`~str_util.word`,
+:func:`~str_util.replace`, :func:`~str_util.replace_substring`, :func:`~str_util.unique` and
+:func:`~str_util.sort` accept a StringColumn and return a new StringColumn. :func:`~str_util.contains`,
+:func:`~str_util.contains_all`, :func:`~str_util.like` and :func:`~str_util.unique_counts` accept it as well,
+and :func:`~str_util.to_list` converts it to a list.
+
+>>> from str_util import lowercase, like
+>>> column = StringColumn(['Red', 'GREEN', 'Blue'])
+>>> lowercase(column)
+StringColumn(['red', 'green', 'blue'])
+>>> like(column, '*e*', ignore_case=True)
+[True, True, True]
+
+A column is saved in a simple binary format, so it can be loaded without unpickling
+
+>>> import io
+>>> file = io.BytesIO()
+>>> column.save(file)
+>>> _ = file.seek(0)
+>>> StringColumn.load(file) == column
+True
+
+"""
+import bisect
+import itertools
+import struct
+import sys
+from array import array
+
+import str_util
+from str_util import to_list, _count, _key, _most_common, _MATCHER_THRESHOLD, _NativeList
+
+_MAGIC = b'STRCOL1\n'
+_OFFSET_TYPE = 'q'
+# the number of strings encoded or decoded at a time
+_CHUNK = 4096
+
+
+class StringColumn(_NativeList):
+    """
+    A read-only sequence of strings, stored in a single UTF-8 buffer
+
+    :type values: list or str
+    :param values: Optional. The strings (default an empty column)
+    """
+
+    def __init__(self, values=()):
+        if isinstance(values, str):
+            values = [values]
+        data = bytearray()
+        offsets = array(_OFFSET_TYPE, [0])
+        ascii_only = True
+        # encode the strings in chunks, so only a chunk of them is copied at a time
+        iterator = iter(values)
+        chunk = list(itertools.islice(iterator, _CHUNK))
+        while chunk:
+            text = ''.join(chunk)
+            encoded = text.encode('utf-8')
+            if len(encoded) == len(text):
+                # only ASCII, so the character lengths are the byte lengths
+                lengths = map(len, chunk)
+            else:
+                ascii_only = False
+                lengths = [len(value.encode('utf-8')) for value in chunk]
+            end = len(data)
+            for length in lengths:
+                end += length
+                offsets.append(end)
+            data += encoded
+            chunk = list(itertools.islice(iterator, _CHUNK))
+        self._data = data
+        self._offsets = offsets
+        self._ascii = ascii_only
+
+    @classmethod
+    def from_buffer(cls, data, offsets):
+        """
+        Create a column from a UTF-8 buffer and the offsets of the strings in it, without copying them
+
+        :param bytes data: the UTF-8 encoded strings
+        :param offsets: the start of each string, followed by the end of the last string
+        :rtype: StringColumn
+        """
+        column = cls.__new__(cls)
+        column._data = data
+        column._offsets = offsets if isinstance(offsets, array) else array(_OFFSET_TYPE, offsets)
+        column._ascii = None
+        return column
+
+    @property
+    def nbytes(self):
+        """
+        The number of bytes used by the buffer and the offsets
+        """
+        return len(self._data) + len(self._offsets) * self._offsets.itemsize
+
+    def _is_ascii(self):
+        if self._ascii is None:
+            try:
+                self._ascii = self._data.isascii()
+            except AttributeError:  # Python < 3.7
+                self._ascii = max(self._data, default=0) < 0x80
+        return self._ascii
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __iter__(self):
+        data = self._data
+        offsets = self._offsets
+        for first in range(0, len(self), _CHUNK):
+            last = min(first + _CHUNK, len(self))
+            base = offsets[first]
+            text = data[base:offsets[last]].decode('utf-8')
+            if len(text) == offsets[last] - base:
+                # only ASCII, so the byte offsets are the character offsets
+                for i in range(first, last):
+                    yield text[offsets[i] - base:offsets[i + 1] - base]
+            else:
+                for i in range(first, last):
+                    yield data[offsets[i]:offsets[i + 1]].decode('utf-8')
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return StringColumn(self.to_list()[index])
+            stop = max(start, stop)
+            base = self._offsets[start]
+            offsets = array(_OFFSET_TYPE, (offset - base for offset in self._offsets[start:stop + 1]))
+            column = StringColumn.from_buffer(self._data[base:self._offsets[stop]], offsets)
+            column._ascii = self._ascii
+            return column
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('StringColumn index out of range')
+        return self._data[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def __eq__(self, other):
+        if isinstance(other, StringColumn):
+            return self._data == other._data and self._offsets == other._offsets
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return 'StringColumn(%r)' % self.to_list()
+
+    def to_list(self):
+        """
+        :return: the strings as a list
+        :rtype: list
+        """
+        return list(self)
+
+    def map(self, function):
+        """
+        Apply a function to each string
+
+        :param function: function called with a string, returning a string
+        :rtype: StringColumn
+        """
+        return StringColumn(function(value) for value in self)
+
+    def save(self, file):
+        """
+        Save the column in a binary file
+
+        :param file: a file name, or a file opened in binary mode
+        """
+        if isinstance(file, str):
+            with open(file, 'wb') as opened:
+                return self.save(opened)
+        offsets = self._offsets
+        if sys.byteorder != 'little':
+            offsets = array(_OFFSET_TYPE, offsets)
+            offsets.byteswap()
+        file.write(_MAGIC)
+        file.write(struct.pack('<q', len(self)))
+        file.write(offsets.tobytes())
+        file.write(self._data)
+
+    @classmethod
+    def load(cls, file):
+        """
+        Load a column saved by :meth:`save`
+
+        :param file: a file name, or a file opened in binary mode
+        :rtype: StringColumn
+        """
+        if isinstance(file, str):
+            with open(file, 'rb') as opened:
+                return cls.load(opened)
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError('Not a StringColumn file')
+        count, = struct.unpack('<q', file.read(8))
+        offsets = array(_OFFSET_TYPE)
+        offsets.frombytes(file.read((count + 1) * offsets.itemsize))
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        data = file.read(offsets[-1])
+        if len(data) != offsets[-1]:
+            raise ValueError('The StringColumn file is truncated')
+        return cls.from_buffer(data, offsets)
+
+    def trim(self):
+        """
+        Same as :func:`~str_util.trim`
+        """
+        return StringColumn(value for value in map(str_util.trim, self) if value)
+
+    def lowercase(self):
+        """
+        Same as :func:`~str_util.lowercase`. A column with only ASCII characters is converted in a single operation
+        """
+        if self._is_ascii():
+            column = StringColumn.from_buffer(self._data.lower(), self._offsets)
+            column._ascii = True
+            return column
+        return self.map(str.casefold)
+
+    def propercase(self):
+        """
+        Same as :func:`~str_util.propercase`
+        """
+        return self.map(str_util.propercase)
+
+    def left(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.left`
+        """
+        return self.map(lambda value: str_util.left(value, find, ignore_case))
+
+    def left_back(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.left_back`
+        """
+        return self.map(lambda value: str_util.left_back(value, find, ignore_case))
+
+    def right(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.right`
+        """
+        return self.map(lambda value: str_util.right(value, find, ignore_case))
+
+    def right_back(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.right_back`
+        """
+        return self.map(lambda value: str_util.right_back(value, find, ignore_case))
+
+    def word(self, number, separator=None):
+        """
+        Same as :func:`~str_util.word`
+        """
+        return self.map(lambda value: str_util.word(value, number, separator))
+
+    def replace(self, fromlist, tolist, ignore_case=False):
+        """
+        Same as :func:`~str_util.replace`
+        """
+        from str_util.replace_map import ReplaceMap
+        return self.map(ReplaceMap(fromlist, tolist, ignore_case).lookup)
+
+    def replace_substring(self, fromlist, tolist, ignore_case=False):
+        """
+        Same as :func:`~str_util.replace_substring`
+        """
+        from str_util.replacer import get_replacer
+        return self.map(get_replacer(fromlist, tolist, ignore_case).replace)
+
+    def contains(self, substrings, ignore_case=False):
+        """
+        Same as :func:`~str_util.contains`. Case-sensitive searches look for the UTF-8 bytes in the buffer,
+        without creating the strings
+        """
+        substrings = to_list(substrings)
+        if len(substrings) >= _MATCHER_THRESHOLD:
+            from str_util.automaton import get_matcher
+            matcher = get_matcher(substrings, ignore_case)
+            return any(matcher.contains(value) for value in self)
+        if ignore_case or '' in substrings:
+            keys = [_key(substring, ignore_case) for substring in substrings]
+            return any(any(key in text for key in keys) for text in (_key(value, ignore_case) for value in self))
+
+        data = self._data
+        offsets = self._offsets
+        for substring in substrings:
+            key = substring.encode('utf-8')
+            position = data.find(key)
+            while position >= 0:
+                # the string holding the first byte of the match
+                end = offsets[bisect.bisect_right(offsets, position)]
+                if position + len(key) <= end:
+                    return True
+                # the match continues in the next string, and so would any later match starting in this string
+                position = data.find(key, end)
+        return False
+
+    def contains_all(self, substrings, ignore_case=False):
+        """
+        Same as :func:`~str_util.contains_all`. The strings are searched one at a time
+        """
+        substrings = to_list(substrings)
+        if len(substrings) >= _MATCHER_THRESHOLD:
+            from str_util.automaton import get_matcher
+            matcher = get_matcher(substrings, ignore_case)
+            return any(matcher.contains_all(value) for value in self)
+        keys = [_key(substring, ignore_case) for substring in substrings]
+        return any(all(key in text for key in keys) for text in (_key(value, ignore_case) for value in self))
+
+    def like(self, pattern, ignore_case=False):
+        """
+        Same as :func:`~str_util.like`
+
+        :return: True or False for each string
+        :rtype: list
+        """
+        from str_util.globbing import compile_like
+        match = compile_like(pattern, ignore_case).match
+        return [match(value) for value in self]
+
+    def unique(self, ignore_case=False):
+        """
+        Same as :func:`~str_util.unique`. Only the (casefolded) distinct strings are kept in memory
+        """
+        from str_util.streaming import iter_unique
+        return StringColumn(iter_unique(self, ignore_case))
+
+    def unique_counts(self, ignore_case=False, top_k=None):
+        """
+        Same as :func:`~str_util.unique_counts`
+        """
+        return _most_common(_count(self, ignore_case), top_k)
+
+    def sort(self, ignore_case=False, reverse=False):
+        """
+        Same as :func:`~str_util.sort`. The strings are held in memory while sorting
+        """
+        return StringColumn(str_util.sort(self.to_list(), ignore_case, reverse))
@@ -0,0 +1,257 @@
+"""
+Dictionary encoded lists, for data with many repeated values like country names or status codes.
+An :class:`EncodedList` stores each distinct value once, and an array with the code (the position in the list of
+distinct values) of each element.
+
+:func:`~str_util.trim`, :func:`~str_util.lowercase`, :func:`~str_util.propercase`, :func:`~str_util.left`,
+:func:`~str_util.left_back`, :func:`~str_util.right`, :func:`~str_util.right_back`, :func:`~str_util.word`,
+:func:`~str_util.replace`, :func:`~str_util.replace_substring`, :func:`~str_util.unique` and :func:`~str_util.sort`
+accept an EncodedList and return a new EncodedList. The function is called once for each distinct value,
+and the codes are reused. :func:`~str_util.contains`, :func:`~str_util.contains_all`, :func:`~str_util.like`
+and :func:`~str_util.unique_counts` accept it as well.
+
+>>> from str_util import lowercase, like
+>>> countries = EncodedList(['DK', 'SE', 'DK', 'dk', 'NO', 'SE'])
+>>> countries.values
+['DK', 'SE', 'dk', 'NO']
+>>> list(countries.codes)
+[0, 1, 0, 2, 3, 1]
+
+>>> lowercase(countries)
+EncodedList(['dk', 'se', 'dk', 'dk', 'no', 'se'])
+>>> lowercase(countries).values
+['dk', 'se', 'no']
+>>> like(countries, '?K')
+[True, False, True, False, False, False]
+
+"""
+from array import array
+from collections import Counter
+
+import str_util
+from str_util import _NativeList, _most_common
+
+
+def _code_array(codes, size):
+    """
+    An array with the codes, using the smallest item size that can hold codes up to *size*
+    """
+    for typecode in 'BHIL':
+        if size <= 2 ** (8 * array(typecode).itemsize):
+            return array(typecode, codes)
+    return array('Q', codes)
+
+
+class EncodedList(_NativeList):
+    """
+    A read-only list stored as the distinct values and a code for each element
+
+    :type values: list or str
+    :param values: Optional. The strings (default an empty list)
+    """
+
+    def __init__(self, values=()):
+        if isinstance(values, str):
+            values = [values]
+        index = {}
+        codes = [index.setdefault(value, len(index)) for value in values]
+        self.values = list(index)
+        self.codes = _code_array(codes, len(self.values))
+
+    @classmethod
+    def from_codes(cls, values, codes):
+        """
+        Create an encoded list from distinct values and the codes of the elements
+
+        :param list values: the distinct values
+        :param codes: the position in *values* of each element
+        :rtype: EncodedList
+        """
+        encoded = cls.__new__(cls)
+        encoded.values = list(values)
+        encoded.codes = codes if isinstance(codes, array) else _code_array(codes, len(encoded.values))
+        return encoded
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return map(self.values.__getitem__, self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # keep only the values used in the slice
+            codes = self.codes[index]
+            used = {code: position for position, code in enumerate(dict.fromkeys(codes))}
+            return EncodedList.from_codes([self.values[code] for code in used],
+                                          _code_array(map(used.__getitem__, codes), len(used)))
+        return self.values[self.codes[index]]
+
+    def __eq__(self, other):
+        if isinstance(other, EncodedList):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return 'EncodedList(%r)' % self.to_list()
+
+    def to_list(self):
+        """
+        :return: the elements as a list
+        :rtype: list
+        """
+        return list(self)
+
+    def map(self, function):
+        """
+        Apply a function to each distinct value. Values which become equal are merged
+
+        :param function: function called with a string, returning a string
+        :rtype: EncodedList
+        """
+        return self._encode([function(value) for value in self.values])
+
+    def _encode(self, new_values):
+        """
+        An EncodedList with *new_values* in place of the distinct values, merging values which are equal
+        """
+        index = {}
+        remap = [index.setdefault(value, len(index)) for value in new_values]
+        if len(index) == len(new_values):
+            return EncodedList.from_codes(new_values, self.codes)
+        return EncodedList.from_codes(list(index), _code_array(map(remap.__getitem__, self.codes), len(index)))
+
+    def _expand(self, results):
+        """
+        The result for each element, from the results for each distinct value
+        """
+        return list(map(results.__getitem__, self.codes))
+
+    def trim(self):
+        """
+        Same as :func:`~str_util.trim`
+        """
+        trimmed = self.map(str_util.trim)
+        if '' not in trimmed.values:
+            return trimmed
+        blank = trimmed.values.index('')
+        values = trimmed.values[:blank] + trimmed.values[blank + 1:]
+        codes = (code - (code > blank) for code in trimmed.codes if code != blank)
+        return EncodedList.from_codes(values, _code_array(codes, len(values)))
+
+    def lowercase(self):
+        """
+        Same as :func:`~str_util.lowercase`
+        """
+        return self.map(str.casefold)
+
+    def propercase(self):
+        """
+        Same as :func:`~str_util.propercase`
+        """
+        return self._encode(str_util.propercase(self.values))
+
+    def left(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.left`
+        """
+        return self._encode(str_util.left(self.values, find, ignore_case))
+
+    def left_back(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.left_back`
+        """
+        return self._encode(str_util.left_back(self.values, find, ignore_case))
+
+    def right(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.right`
+        """
+        return self._encode(str_util.right(self.values, find, ignore_case))
+
+    def right_back(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.right_back`
+        """
+        return self._encode(str_util.right_back(self.values, find, ignore_case))
+
+    def word(self, number, separator=None):
+        """
+        Same as :func:`~str_util.word`
+        """
+        return self._encode(str_util.word(self.values, number, separator))
+
+    def replace(self, fromlist, tolist, ignore_case=False):
+        """
+        Same as :func:`~str_util.replace`
+        """
+        return self._encode(str_util.replace(self.values, fromlist, tolist, ignore_case))
+
+    def replace_substring(self, fromlist, tolist, ignore_case=False):
+        """
+        Same as :func:`~str_util.replace_substring`
+        """
+        return self._encode(str_util.replace_substring(self.values, fromlist, tolist, ignore_case))
+
+    def contains(self, substrings, ignore_case=False):
+        """
+        Same as :func:`~str_util.contains`. Only the distinct values are searched
+        """
+        return bool(self.codes) and str_util.contains(self.values, substrings, ignore_case)
+
+    def contains_all(self, substrings, ignore_case=False):
+        """
+        Same as :func:`~str_util.contains_all`. Only the distinct values are searched
+        """
+        return bool(self.codes) and str_util.contains_all(self.values, substrings, ignore_case)
+
+    def like(self, pattern, ignore_case=False):
+        """
+        Same as :func:`~str_util.like`
+
+        :return: True or False for each element
+        :rtype: list
+        """
+        return self._expand(str_util.like(self.values, pattern, ignore_case))
+
+    def unique(self, ignore_case=False):
+        """
+        Same as :func:`~str_util.unique`
+        """
+        # the distinct values in the order they first occur, then merged when ignoring case
+        first = [self.values[code] for code in dict.fromkeys(self.codes)]
+        return EncodedList(str_util.unique(first, ignore_case))
+
+    def unique_counts(self, ignore_case=False, top_k=None):
+        """
+        Same as :func:`~str_util.unique_counts`. Only the codes are counted
+        """
+        pairs = [(self.values[code], count) for code, count in Counter(self.codes).items()]
+        if ignore_case:
+            counts = {}
+            first = {}
+            for value, count in pairs:
+                key = value.casefold()
+                counts[key] = counts.get(key, 0) + count
+                first.setdefault(key, value)
+            pairs = [(first[key], count) for key, count in counts.items()]
+        return _most_common(pairs, top_k)
+
+    def sort(self, ignore_case=False, reverse=False):
+        """
+        Same as :func:`~str_util.sort`. The distinct values are sorted, and the codes are sorted by the rank of
+        their value. Elements with equal values keep their order, like in :func:`sorted`
+        """
+        keys = str_util.lowercase(self.values) if ignore_case else self.values
+        ranks = [0] * len(keys)
+        rank = -1
+        previous = None
+        for position, code in enumerate(sorted(range(len(keys)), key=keys.__getitem__)):
+            if position == 0 or keys[code] != previous:
+                rank += 1
+                previous = keys[code]
+            ranks[code] = rank
+        codes = sorted(self.codes, key=ranks.__getitem__, reverse=reverse)
+        return EncodedList.from_codes(self.values, _code_array(codes, len(self.values)))
@@ -0,0 +1,77 @@
+from str_util import to_list
+
+
+class FoldedString(str):
+    """
+    A string that remembers its casefolded form. It behaves exactly like the original string, but
+    ``casefold()`` returns the stored value instead of folding the string again.
+
+    Use it when the same string is searched or compared case-insensitively many times. All ignore_case paths in
+    str_util (:func:`~str_util.index_of`, :func:`~str_util.contains`, :func:`~str_util.is_member`,
+    :func:`~str_util.sort`, :func:`~str_util.compare`, :func:`~str_util.like`...) fold values with ``casefold()``
+
+    :param str value: the string
+
+    >>> text = FoldedString('Der Fluß')
+    >>> text
+    'Der Fluß'
+    >>> text.casefold()
+    'der fluss'
+
+    >>> from str_util import index_of
+    >>> index_of(text, 'FLUSS', ignore_case=True)
+    4
+
+    """
+    __slots__ = ('_folded',)
+
+    def __new__(cls, value):
+        if isinstance(value, FoldedString):
+            return value
+        folded_string = super().__new__(cls, value)
+        folded_string._folded = str.casefold(folded_string)
+        return folded_string
+
+    def casefold(self):
+        return self._folded
+
+    def __reduce__(self):
+        return FoldedString, (str(self),)
+
+
+class FoldedList(list):
+    """
+    A list of :class:`FoldedString`, which is casefolded once when the list is created. It can be passed to any
+    str_util function, and the ignore_case paths use the stored casefolded values instead of folding
+    the list again.
+
+    The casefolded values are also available as the ``folded`` list. A FoldedList can't be modified, as that would
+    make the two lists differ. Create a new FoldedList instead
+
+    :type values: list or str
+    :param values: the values
+
+    >>> colors = FoldedList(['Red', 'GREEN', 'Blue'])
+    >>> colors.folded
+    ['red', 'green', 'blue']
+
+    >>> from str_util import is_member, sort
+    >>> is_member(['green', 'BLUE'], colors, ignore_case=True)
+    True
+    >>> sort(colors, ignore_case=True)
+    ['Blue', 'GREEN', 'Red']
+
+    """
+
+    def __init__(self, values=()):
+        super().__init__(FoldedString(entry) for entry in to_list(values))
+        self.folded = [entry.casefold() for entry in self]
+
+    def __reduce__(self):
+        return FoldedList, (list(self),)
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('FoldedList is read-only')
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
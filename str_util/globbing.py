@@ -0,0 +1,225 @@
+import fnmatch
+import functools
+import heapq
+import re
+
+from str_util import is_list, to_list, _key
+
+
+def _ignore_case_match(pattern):
+    """
+    Return a function which tests if a string matches the pattern, ignoring case. The string is matched with a
+    case-insensitive regular expression. If casefolding changes the length of the string or the pattern (ß -> ss),
+    the casefolded string is also matched with the casefolded pattern, so 'Der Fluß' is like 'DER FLUSS'.
+    Casefolding alone is not enough, as a changed length breaks ? and [...]
+
+    >>> match = _ignore_case_match('Stra?e')
+    >>> match('STRAßE'), match('Strasse')
+    (True, False)
+    >>> _ignore_case_match('DER FLUSS')('Der Fluß')
+    True
+    """
+    match = re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+    folded_pattern = pattern.casefold()
+    match_folded = re.compile(fnmatch.translate(folded_pattern)).match
+    pattern_changed = len(folded_pattern) != len(pattern)
+
+    def ignore_case_match(string):
+        if match(string) is not None:
+            return True
+        folded = string.casefold()
+        return (pattern_changed or len(folded) != len(string)) and match_folded(folded) is not None
+    return ignore_case_match
+
+
+class LikePattern:
+    """
+    A compiled :func:`~str_util.like` pattern. The pattern is translated to a regular expression once,
+    and can then be matched against many strings. Use :func:`compile_like` to get a (cached) instance
+
+    :param str pattern: the pattern. Use ? for any char or * for any sentence.
+        More info: `fnmatch <https://docs.python.org/3/library/fnmatch.html>`_
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+
+    >>> pattern = LikePattern('Pe?er*')
+    >>> pattern.filter(['Petersen', 'Pedersen', 'Peter', 'Olsen'])
+    ['Petersen', 'Pedersen', 'Peter']
+
+    >>> LikePattern('DER FLUSS', ignore_case=True).match('Der Fluß')
+    True
+
+    """
+
+    def __init__(self, pattern, ignore_case=False):
+        self.pattern = pattern
+        self.ignore_case = ignore_case
+        if ignore_case:
+            self._match = _ignore_case_match(pattern)
+        else:
+            self._match = re.compile(fnmatch.translate(pattern)).match
+
+    def match(self, string):
+        """
+        Matches a string or each element of a list with the pattern
+
+        :param str,list string: the value to be tested
+        :return: True if the pattern matches the string. For a list, a list of booleans
+        :rtype: bool,list
+        """
+        if is_list(string):
+            return self.mask(string)
+        return bool(self._match(string))
+
+    def mask(self, strings):
+        """
+        :param list strings: the values to be tested
+        :return: a list with True for each element matching the pattern, otherwise False
+        :rtype: list
+        """
+        match = self._match
+        if self.ignore_case:
+            return [match(entry) for entry in to_list(strings)]
+        return [match(entry) is not None for entry in to_list(strings)]
+
+    def filter(self, strings):
+        """
+        :param list strings: the values to be tested
+        :return: the elements matching the pattern
+        :rtype: list
+        """
+        match = self._match
+        return [entry for entry in to_list(strings) if match(entry)]
+
+
+@functools.lru_cache(maxsize=256)
+def compile_like(pattern, ignore_case=False):
+    """
+    Compile a :func:`~str_util.like` pattern. Recently compiled patterns are cached and reused
+
+    :param str pattern: the pattern. Use ? for any char or * for any sentence.
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    :return: the compiled pattern
+    :rtype: LikePattern
+
+    >>> compile_like('*.txt').mask(['a.txt', 'b.csv'])
+    [True, False]
+    """
+    return LikePattern(pattern, ignore_case)
+
+
+_WILDCARDS = re.compile(r'[*?[]')
+_LAST_WILDCARD = re.compile(r'.*[*?[\]]', re.DOTALL)
+
+
+class LikeSet:
+    """
+    Matches strings against many :func:`~str_util.like` patterns at once, e.g. to route values by a table of rules.
+
+    Patterns without wildcards are found with a dictionary lookup. The other patterns are grouped by the
+    literal text before the first wildcard (or after the last wildcard, for patterns like ``*.txt``),
+    so only patterns with a matching prefix or suffix are tested.
+
+    :type patterns: list or dict
+    :param patterns: the patterns. For a list, the id of a pattern is its position in the list.
+        For a dict, the keys are the ids and the values the patterns
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+
+    >>> rules = LikeSet({'jpeg': '*.jp*g', 'text': '*.txt', 'readme': 'README*'}, ignore_case=True)
+    >>> rules.first('photo.JPEG')
+    'jpeg'
+
+    >>> rules.first(['readme.txt', 'photo.png'])
+    ['text', None]
+
+    >>> rules.matches('readme.txt')
+    ['text', 'readme']
+
+    """
+
+    def __init__(self, patterns, ignore_case=False):
+        if not isinstance(patterns, dict):
+            patterns = dict(enumerate(to_list(patterns)))
+        self.patterns = patterns
+        self.ignore_case = ignore_case
+
+        # each rule is an (order, id, match) tuple, and all lists of rules are sorted by order
+        self._literals = {}
+        self._prefixes = {}
+        self._suffixes = {}
+        self._wildcards = []
+        for order, (pattern_id, pattern) in enumerate(patterns.items()):
+            key = _key(pattern, ignore_case)
+            wildcard = _WILDCARDS.search(key)
+            if wildcard is None:
+                self._literals.setdefault(key, []).append((order, pattern_id, None))
+                continue
+            # bucket by the casefolded text, but match the original value like LikePattern does
+            if ignore_case:
+                match = _ignore_case_match(pattern)
+            else:
+                match = re.compile(fnmatch.translate(pattern)).match
+            rule = (order, pattern_id, match)
+            prefix = key[:wildcard.start()]
+            suffix = key[_LAST_WILDCARD.match(key).end():]
+            if prefix:
+                self._prefixes.setdefault(prefix, []).append(rule)
+            elif suffix:
+                self._suffixes.setdefault(suffix, []).append(rule)
+            else:
+                self._wildcards.append(rule)
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffixes})
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def _candidates(self, key):
+        """
+        The lists of rules that may match the key
+        """
+        candidates = [self._wildcards]
+        literals = self._literals.get(key)
+        if literals:
+            candidates.append(literals)
+        for length in self._prefix_lengths:
+            if length > len(key):
+                break
+            rules = self._prefixes.get(key[:length])
+            if rules:
+                candidates.append(rules)
+        for length in self._suffix_lengths:
+            if length > len(key):
+                break
+            rules = self._suffixes.get(key[-length:])
+            if rules:
+                candidates.append(rules)
+        return candidates
+
+    def first(self, value):
+        """
+        Find the first pattern matching a string, or each element of a list
+
+        :param str,list value: the value(s) to be tested
+        :return: the id of the first matching pattern, or None if no pattern matches. For a list, a list of ids
+        """
+        if is_list(value):
+            return [self.first(entry) for entry in value]
+        key = _key(value, self.ignore_case)
+        for _, pattern_id, match in heapq.merge(*self._candidates(key)):
+            if match is None or match(value):
+                return pattern_id
+        return None
+
+    def matches(self, value):
+        """
+        Find all patterns matching a string, or each element of a list
+
+        :param str,list value: the value(s) to be tested
+        :return: list with the ids of all matching patterns, in pattern order. For a list, a list of lists
+        :rtype: list
+        """
+        if is_list(value):
+            return [self.matches(entry) for entry in value]
+        key = _key(value, self.ignore_case)
+        return [pattern_id for _, pattern_id, match in heapq.merge(*self._candidates(key))
+                if match is None or match(value)]
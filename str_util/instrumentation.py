@@ -0,0 +1,207 @@
+"""
+Opt-in instrumentation of the public str_util functions. When enabled, every call records the latency,
+the length of the input list and whether ignore_case was used.
+
+>>> import str_util
+>>> from str_util import instrumentation
+>>> instrumentation.reset()
+>>> instrumentation.enable()
+>>> str_util.trim(['  a  ', 'b']), str_util.trim('x ')
+(['a', 'b'], 'x')
+>>> instrumentation.disable()
+>>> stats = instrumentation.stats()['trim']
+>>> stats['calls'], stats['list_calls'], stats['input_length']['total']
+(2, 1, 2)
+
+The functions are instrumented by replacing them in the ``str_util`` package with a wrapper. When instrumentation
+is disabled the original functions are put back, so there is no overhead at all. Functions imported by name
+before :func:`enable` is called (``from str_util import trim``) are not instrumented.
+
+Only the outermost str_util call is recorded, so ``left`` calling ``index_of`` counts as one call to ``left``.
+Generator functions (``iter_*``) are not instrumented.
+"""
+import functools
+import inspect
+import json
+import threading
+import time
+import types
+
+import str_util
+
+_lock = threading.Lock()
+_local = threading.local()
+_originals = {}
+_stats = {}
+
+# latencies are counted in buckets of powers of two microseconds: bucket i holds latencies below 2**i µs
+_LATENCY_BUCKETS = 32
+
+
+class _FunctionStats:
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.latencies = [0] * _LATENCY_BUCKETS
+        self.ignore_case_calls = 0
+        self.list_calls = 0
+        self.total_length = 0
+        self.max_length = 0
+        self.lengths = {}  # bit length -> count, i.e. bucket i holds lengths below 2**i
+
+    def add(self, seconds, length, ignore_case):
+        self.calls += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.latencies[min(int(seconds * 1e6).bit_length(), _LATENCY_BUCKETS - 1)] += 1
+        if ignore_case:
+            self.ignore_case_calls += 1
+        if length is not None:
+            self.list_calls += 1
+            self.total_length += length
+            self.max_length = max(self.max_length, length)
+            bucket = length.bit_length()
+            self.lengths[bucket] = self.lengths.get(bucket, 0) + 1
+
+    def percentile(self, fraction):
+        """
+        Estimated latency percentile: the upper bound of the bucket holding the percentile, capped at the max
+        """
+        if not self.calls:
+            return 0.0
+        remaining = fraction * self.calls
+        for bucket, count in enumerate(self.latencies):
+            remaining -= count
+            if remaining <= 0:
+                return min(2 ** bucket / 1e6, self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self):
+        return {
+            'calls': self.calls,
+            'total_seconds': self.total_seconds,
+            'mean_seconds': self.total_seconds / self.calls if self.calls else 0.0,
+            'p50_seconds': self.percentile(0.5),
+            'p90_seconds': self.percentile(0.9),
+            'p99_seconds': self.percentile(0.99),
+            'max_seconds': self.max_seconds,
+            'latency_histogram': {'<%gs' % (2 ** bucket / 1e6): count
+                                  for bucket, count in enumerate(self.latencies) if count},
+            'ignore_case_calls': self.ignore_case_calls,
+            'list_calls': self.list_calls,
+            'input_length': {
+                'total': self.total_length,
+                'max': self.max_length,
+                'histogram': {'<%d' % 2 ** bucket: count for bucket, count in sorted(self.lengths.items())},
+            },
+        }
+
+
+def _public_functions():
+    """
+    The instrumentable functions of the str_util package, by name
+    """
+    for attribute in str_util._LAZY:  # load the lazily imported functions, so they can be instrumented too
+        getattr(str_util, attribute)
+    return {name: value for name, value in vars(str_util).items()
+            if isinstance(value, types.FunctionType) and not name.startswith('_')
+            and not inspect.isgeneratorfunction(value)}
+
+
+def _ignore_case_getter(function):
+    """
+    Return a function that finds the ignore_case argument of a call, or None if the function has no ignore_case
+    """
+    parameters = list(inspect.signature(function).parameters.values())
+    for position, parameter in enumerate(parameters):
+        if parameter.name == 'ignore_case':
+            default = parameter.default is True
+            return lambda args, kwargs: args[position] if len(args) > position else kwargs.get('ignore_case', default)
+    return None
+
+
+def _instrument(name, function):
+    get_ignore_case = _ignore_case_getter(function)
+    clock = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, 'active', False):
+            return function(*args, **kwargs)
+        _local.active = True
+        start = clock()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = clock() - start
+            _local.active = False
+            length = len(args[0]) if args and isinstance(args[0], list) else None
+            ignore_case = bool(get_ignore_case(args, kwargs)) if get_ignore_case else False
+            with _lock:
+                stats = _stats.get(name)
+                if stats is None:
+                    stats = _stats[name] = _FunctionStats()
+                stats.add(seconds, length, ignore_case)
+
+    return wrapper
+
+
+def enable():
+    """
+    Start recording calls to the public str_util functions
+    """
+    with _lock:
+        if _originals:
+            return
+        for name, function in _public_functions().items():
+            _originals[name] = function
+            setattr(str_util, name, _instrument(name, function))
+
+
+def disable():
+    """
+    Stop recording, and restore the original functions. The recorded statistics are kept
+    """
+    with _lock:
+        for name, function in _originals.items():
+            setattr(str_util, name, function)
+        _originals.clear()
+
+
+def is_enabled():
+    """
+    :return: True if instrumentation is enabled
+    :rtype: bool
+    """
+    return bool(_originals)
+
+
+def reset():
+    """
+    Clear the recorded statistics
+    """
+    with _lock:
+        _stats.clear()
+
+
+def stats():
+    """
+    Return the recorded statistics for each function that has been called.
+    Latency percentiles are estimated from a histogram with buckets of powers of two microseconds
+
+    :return: dict with function name -> dict of statistics
+    :rtype: dict
+    """
+    with _lock:
+        return {name: function_stats.to_dict() for name, function_stats in sorted(_stats.items())}
+
+
+def to_json(**kwargs):
+    """
+    Return the recorded statistics as JSON, see :func:`stats`
+
+    :param kwargs: passed on to :func:`json.dumps`
+    :rtype: str
+    """
+    return json.dumps(stats(), **kwargs)
@@ -0,0 +1,193 @@
+from str_util import to_list, _key, _Lookup
+
+
+class ListIndex(_Lookup):
+    """
+    A list with a hash index, for repeated lookups against the same (possibly growing) list.
+    The index maps each value to its first position, so :meth:`index_of`, :meth:`is_member`, :meth:`replace`
+    and :meth:`intersection` don't have to scan the list.
+
+    Values can be added with :meth:`append` and :meth:`extend`, and removed with :meth:`remove`.
+    Positions are kept up to date, just like in a list.
+
+    A ListIndex can also be passed as the list to search in to :func:`~str_util.is_member`, :func:`~str_util.diff`
+    and :func:`~str_util.intersection`, with the same *ignore_case* as the index.
+
+    :type source_list: list or str
+    :param source_list: Optional. The values to index (default an empty list). The list is copied
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+
+    >>> colors = ListIndex(['Red', 'Green', 'Blue', 'green'], ignore_case=True)
+    >>> colors.index_of('GREEN')
+    1
+    >>> colors.is_member(['red', 'blue'])
+    True
+    >>> colors.replace(['red', 'yellow', 'blue'], ['R', 'G', 'B'])
+    ['R', 'yellow', 'B']
+
+    >>> colors.remove('RED')
+    >>> colors.index_of('green')
+    0
+    >>> colors.append('Yellow')
+    >>> list(colors)
+    ['Green', 'Blue', 'green', 'Yellow']
+
+    """
+
+    def __init__(self, source_list=(), ignore_case=False):
+        self.ignore_case = ignore_case
+        self._values = []
+        self._alive = bytearray()
+        self._next = []  # position of the next value with the same key, or -1
+        self._first = {}  # key -> position of the first value with that key
+        self._last = {}  # key -> position of the last value with that key
+        self._removed = 0
+        # Fenwick tree counting the values that aren't removed, to map positions in _values to list positions.
+        # Only maintained after the first remove
+        self._tree = None
+        self.extend(source_list)
+
+    def __len__(self):
+        return len(self._values) - self._removed
+
+    def __iter__(self):
+        if not self._removed:
+            return iter(self._values)
+        return (value for value, alive in zip(self._values, self._alive) if alive)
+
+    def __contains__(self, value):
+        return _key(value, self.ignore_case) in self._first
+
+    def __repr__(self):
+        return 'ListIndex(%r, ignore_case=%r)' % (list(self), self.ignore_case)
+
+    def _count_before(self, position):
+        """
+        Number of values before *position* in _values, which haven't been removed
+        """
+        if not self._removed:
+            return position
+        total = 0
+        tree = self._tree
+        while position > 0:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def _build_tree(self):
+        size = len(self._values)
+        tree = [0] + list(self._alive)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def append(self, value):
+        """
+        Add a value to the end of the list
+        """
+        position = len(self._values)
+        key = _key(value, self.ignore_case)
+        self._values.append(value)
+        self._alive.append(1)
+        self._next.append(-1)
+        last = self._last.get(key)
+        if last is None:
+            self._first[key] = position
+        else:
+            self._next[last] = position
+        self._last[key] = position
+
+        if self._tree is not None:
+            i = position + 1
+            self._tree.append(1 + self._count_before(i - 1) - self._count_before(i - (i & -i)))
+
+    def extend(self, values):
+        """
+        Add all values to the end of the list
+
+        :type values: list or str
+        """
+        for value in to_list(values):
+            self.append(value)
+
+    def remove(self, value):
+        """
+        Remove the first occurrence of a value. Raises ValueError if the value is not in the list, like ``list.remove``
+        """
+        key = _key(value, self.ignore_case)
+        position = self._first.get(key)
+        if position is None:
+            raise ValueError('%r is not in the list' % (value,))
+
+        next_position = self._next[position]
+        if next_position < 0:
+            del self._first[key]
+            del self._last[key]
+        else:
+            self._first[key] = next_position
+
+        if self._tree is None:
+            self._build_tree()
+        self._alive[position] = 0
+        self._removed += 1
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] -= 1
+            i += i & -i
+
+    def index_of(self, value):
+        """
+        Same as :func:`~str_util.index_of` on the list
+
+        :return: the position of the first value equal to *value*, or -1 if not found
+        :rtype: int
+        """
+        position = self._first.get(_key(value, self.ignore_case))
+        if position is None:
+            return -1
+        return self._count_before(position)
+
+    def is_member(self, values):
+        """
+        Same as ``is_member(values, list)``: check if all values can be found in the list
+
+        :type values: list or str
+        :rtype: bool
+        """
+        return all(_key(value, self.ignore_case) in self._first for value in to_list(values))
+
+    def intersection(self, values):
+        """
+        Same as ``intersection(values, list)``: the values which can be found in the list
+
+        :type values: list or str
+        :rtype: list
+        """
+        return [value for value in to_list(values) if _key(value, self.ignore_case) in self._first]
+
+    def diff(self, values):
+        """
+        Same as ``diff(values, list)``: the values which can't be found in the list
+
+        :type values: list or str
+        :rtype: list
+        """
+        return [value for value in to_list(values) if _key(value, self.ignore_case) not in self._first]
+
+    def replace(self, source, tolist):
+        """
+        Same as ``replace(source, list, tolist)``: values found in the list are replaced by the value at the same
+        position in *tolist*. If *tolist* is shorter than the list, the last value is repeated
+
+        :type source: list or str
+        :type tolist: list or str
+        :rtype: list
+        """
+        tolist = to_list(tolist)
+        result = []
+        for value in to_list(source):
+            position = self.index_of(value)
+            result.append(value if position < 0 else tolist[min(position, len(tolist) - 1)])
+        return result
@@ -0,0 +1,274 @@
+"""
+Vectorized versions of the str_util functions for `NumPy <https://numpy.org>`_ arrays. The functions accept
+string or object arrays (or anything :func:`numpy.asarray` accepts), work on all elements at once, and return
+arrays instead of lists. This module requires NumPy, which is not installed with str_util.
+
+Unlike the list functions, :func:`contains` returns a result per element, and ignore_case uses ``str.lower``
+instead of ``str.casefold``
+
+>>> from str_util import numpy_backend as nb
+>>> nb.left(['Jakob', 'Majkilde'], 2).tolist()
+['Ja', 'Ma']
+
+>>> nb.contains(['Red Blue', 'Yellow', 'Green'], ['BLUE', 'green'], ignore_case=True).tolist()
+[True, False, True]
+
+"""
+import numpy
+
+from str_util import to_list
+from str_util.replacer import get_replacer
+
+# numpy.strings was added in NumPy 2.0, older versions have the same functions in numpy.char
+_strings = getattr(numpy, 'strings', numpy.char)
+
+# the whitespace characters (besides space) recognized by str.split(), which trim() turns into spaces
+_WHITESPACE = ('\x09\x0a\x0b\x0c\x0d\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000'
+               '\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000')
+
+
+def _as_array(values):
+    """
+    Convert the values to a NumPy array of fixed width unicode strings
+    """
+    array = numpy.asarray(values)
+    if array.dtype.kind != 'U':
+        array = array.astype(str)
+    return array
+
+
+def _fold(array, ignore_case):
+    if ignore_case:
+        return _strings.lower(array)
+    return array
+
+
+def _bound(position, lengths, default):
+    """
+    Resolve a slice position (int, array or None) the way Python does, for strings with the given lengths
+    """
+    if position is None:
+        return default
+    position = numpy.asarray(position)
+    return numpy.clip(numpy.where(position < 0, lengths + position, position), 0, lengths)
+
+
+def _slice(array, start=None, stop=None):
+    """
+    Vectorized ``value[start:stop]`` for each element. *start* and *stop* may be ints or arrays
+    """
+    lengths = _strings.str_len(array)
+    start = numpy.broadcast_to(_bound(start, lengths, 0), array.shape).ravel()
+    stop = numpy.broadcast_to(_bound(stop, lengths, lengths), array.shape).ravel()
+    stop = numpy.maximum(stop, start)
+
+    width = int((stop - start).max(initial=0))
+    if width == 0:
+        return numpy.zeros(array.shape, dtype='<U1')
+
+    # view the strings as a matrix of single chars, and pick the chars of each substring
+    chars = numpy.ascontiguousarray(array).reshape(-1).view('<U1').reshape(array.size, -1)
+    positions = start[:, None] + numpy.arange(width)
+    valid = positions < stop[:, None]
+    substrings = chars[numpy.arange(array.size)[:, None], numpy.minimum(positions, chars.shape[1] - 1)]
+    substrings[~valid] = ''
+    return substrings.view('<U%d' % width).reshape(array.shape)
+
+
+def lowercase(values):
+    """
+    Vectorized :func:`~str_util.lowercase`
+
+    >>> lowercase(['Green', 'RED']).tolist()
+    ['green', 'red']
+    """
+    return _strings.lower(_as_array(values))
+
+
+def trim(values):
+    """
+    Vectorized :func:`~str_util.trim`. Removes leading, trailing and redundant whitespace, and empty elements
+
+    >>> trim(['  A  B\\tC ', '   ', 'D']).tolist()
+    ['A B C', 'D']
+    """
+    array = _as_array(values)
+    for char in _WHITESPACE:
+        if (_strings.find(array, char) >= 0).any():
+            array = _strings.replace(array, char, ' ')
+    while (_strings.find(array, '  ') >= 0).any():
+        array = _strings.replace(array, '  ', ' ')
+    array = _strings.strip(array, ' ')
+    return array[_strings.str_len(array) > 0]
+
+
+def find(values, substring, ignore_case=False, reverse=False):
+    """
+    Find the position of the substring in each element, like :func:`~str_util.index_of` on a string
+
+    :return: array with the position of the substring in each element, or -1 if not found
+
+    >>> find(['Jakob', 'Majkilde'], 'K', ignore_case=True).tolist()
+    [2, 3]
+    """
+    array = _fold(_as_array(values), ignore_case)
+    substring = substring.lower() if ignore_case else substring
+    if reverse:
+        return _strings.rfind(array, substring)
+    return _strings.find(array, substring)
+
+
+def index_of(values, value, ignore_case=False, reverse=False):
+    """
+    Vectorized :func:`~str_util.index_of` for a list: the position of the first element equal to *value*
+
+    :param bool reverse: Optional. Specify True to return the position of the last equal element (default False)
+    :return: the position, or -1 if not found
+    :rtype: int
+
+    >>> index_of(['Red', 'Green', 'Blue'], 'green', ignore_case=True)
+    1
+    """
+    array = _fold(_as_array(values), ignore_case)
+    value = value.lower() if ignore_case else value
+    positions = numpy.flatnonzero(array == value)
+    if positions.size == 0:
+        return -1
+    return int(positions[-1] if reverse else positions[0])
+
+
+def contains(values, substrings, ignore_case=False):
+    """
+    Determine for each element if it contains any of the substrings, see :func:`~str_util.contains`
+
+    :return: boolean array. Use ``.any()`` to get the result of :func:`~str_util.contains`
+    """
+    array = _fold(_as_array(values), ignore_case)
+    result = numpy.zeros(array.shape, dtype=bool)
+    for substring in to_list(substrings):
+        substring = substring.lower() if ignore_case else substring
+        result |= _strings.find(array, substring) >= 0
+    return result
+
+
+def left(values, find_value, ignore_case=False):
+    """
+    Vectorized :func:`~str_util.left`. *find_value* is a number of characters or a substring
+
+    >>> left(['Hello World', 'Bye'], 'o').tolist()
+    ['Hell', '']
+    """
+    array = _as_array(values)
+    if isinstance(find_value, int):
+        return _slice(array, None, find_value)
+    positions = find(array, find_value, ignore_case)
+    return _slice(array, 0, numpy.where(positions > 0, positions, 0))
+
+
+def left_back(values, find_value, ignore_case=False):
+    """
+    Vectorized :func:`~str_util.left_back`. *find_value* is a number of characters or a substring
+    """
+    array = _as_array(values)
+    if isinstance(find_value, int):
+        if find_value > 0:
+            return _slice(array, None, -find_value)
+        return array
+    positions = find(array, find_value, ignore_case, reverse=True)
+    return _slice(array, 0, numpy.where(positions >= 0, positions, 0))
+
+
+def right(values, find_value, ignore_case=False):
+    """
+    Vectorized :func:`~str_util.right`. *find_value* is a number of characters or a substring
+
+    >>> right(['Hello World', 'Bye'], 3).tolist()
+    ['lo World', '']
+    """
+    array = _as_array(values)
+    if isinstance(find_value, int):
+        return _slice(array, find_value, None)
+    positions = find(array, find_value, ignore_case)
+    return _slice(array, numpy.where(positions >= 0, positions + len(find_value), _strings.str_len(array)), None)
+
+
+def right_back(values, find_value, ignore_case=False):
+    """
+    Vectorized :func:`~str_util.right_back`. *find_value* is a number of characters or a substring
+    """
+    array = _as_array(values)
+    if isinstance(find_value, int):
+        if find_value > 0:
+            return _slice(array, -find_value, None)
+        return array
+    positions = find(array, find_value, ignore_case, reverse=True)
+    return _slice(array, numpy.where(positions >= 0, positions + len(find_value), _strings.str_len(array)), None)
+
+
+def _can_overlap(words):
+    """
+    Check if replacing the words one after another may give another result than the single left-to-right scan of
+    a :class:`~str_util.replacer.Replacer`: a word is blank, a word contains another word, or a word ends with
+    the beginning of another word
+
+    >>> _can_overlap(['&', '<']), _can_overlap(['bc', 'ab']), _can_overlap(['a', 'ab'])
+    (False, True, True)
+    """
+    if '' in words:
+        return True
+    for i, first in enumerate(words):
+        for j, second in enumerate(words):
+            if i == j:
+                continue
+            if first in second:
+                return True
+            if any(first.endswith(second[:size]) for size in range(1, min(len(first), len(second)))):
+                return True
+    return False
+
+
+def replace_substring(values, fromlist, tolist, ignore_case=False):
+    """
+    Vectorized :func:`~str_util.replace_substring`.
+
+    Each word is first replaced by a placeholder character, so replaced text is not replaced again.
+    The array is widened to fit the longest word first.
+    With ignore_case, when a word is blank or can overlap another word, or if the text contains the placeholder
+    characters, a :class:`~str_util.replacer.Replacer` is applied to each element instead
+
+    >>> replace_substring(['a & b', 'c < d'], ['&', '<'], ['&amp;', '&lt;']).tolist()
+    ['a &amp; b', 'c &lt; d']
+    """
+    array = _as_array(values)
+    if not array.size:
+        return array
+    replacer = get_replacer(fromlist, tolist, ignore_case)
+    # numpy casts the words to the width of the array, so a word longer than the array would be cut,
+    # and match the strings it starts with
+    width = max([array.dtype.itemsize // 4, 1] + [len(word) for word in replacer.fromlist + replacer.tolist])
+    array = array.astype('<U%d' % width)
+    # placeholders from Unicode plane 15, which is reserved for private use
+    placeholders = [chr(0xF0000 + i) for i in range(len(replacer.fromlist))]
+    if ignore_case or _can_overlap(replacer.fromlist) or \
+            any((_strings.find(array, char) >= 0).any() for char in placeholders):
+        return _as_array(numpy.frompyfunc(replacer.replace, 1, 1)(array))
+
+    for from_str, char in zip(replacer.fromlist, placeholders):
+        array = _strings.replace(array, from_str, char)
+    for to_str, char in zip(replacer.tolist, placeholders):
+        array = _strings.replace(array, char, to_str)
+    return array
+
+
+def compare(values1, values2, ignore_case=False):
+    """
+    Vectorized :func:`~str_util.compare`. Compares the elements pairwise (or each element with a string)
+
+    :return: integer array with -1, 0 or 1 for each pair
+
+    >>> compare(['Banana', 'apple'], 'Apple', ignore_case=True).tolist()
+    [1, 0]
+    """
+    array1 = _fold(_as_array(values1), ignore_case)
+    array2 = _fold(_as_array(values2), ignore_case)
+    return (array1 > array2).astype(int) - (array1 < array2).astype(int)
@@ -0,0 +1,145 @@
+"""
+Parallel versions of the list functions. Large lists are split into chunks, which are processed in a pool
+of worker processes. The result is the same as calling the str_util function directly, in the same order.
+
+Lists shorter than ``threshold`` (default :data:`THRESHOLD`) are processed in the current process, so small
+inputs never pay for starting the pool.
+
+>>> from str_util import parallel
+>>> parallel.trim(['  a ', ' ', 'b  '])
+['a', 'b']
+
+>>> parallel.word(['North, West', 'South, East'] * 3, 2, ', ', workers=2, threshold=0)
+['West', 'East', 'West', 'East', 'West', 'East']
+
+"""
+import concurrent.futures
+import itertools
+import os
+
+import str_util
+
+#: Lists with fewer elements than this are not processed in parallel
+THRESHOLD = 100000
+
+# number of chunks per worker. More chunks balance the load better, fewer chunks have less overhead
+_CHUNKS_PER_WORKER = 4
+
+
+def _call(function, chunk, args, kwargs):
+    return function(chunk, *args, **kwargs)
+
+
+def _chunks(values, count):
+    size = -(-len(values) // count)
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+
+def run(function, values, *args, workers=None, threshold=None, **kwargs):
+    """
+    Call a str_util list function in parallel, as ``function(values, *args, **kwargs)``.
+    The function must process each element independently, like :func:`~str_util.trim` or :func:`~str_util.word`
+
+    :param function: the function to call. It must be a module level function, so it can be sent to the workers
+    :param list values: the values to process
+    :param int workers: Optional. Number of worker processes (default is the number of CPUs)
+    :param int threshold: Optional. Lists shorter than this are not processed in parallel (default :data:`THRESHOLD`)
+    :return: the combined result
+    :rtype: list
+    """
+    if threshold is None:
+        threshold = THRESHOLD
+    workers = workers or os.cpu_count() or 1
+    if not str_util.is_list(values) or len(values) < max(threshold, 1) or workers < 2:
+        return function(values, *args, **kwargs)
+
+    chunks = _chunks(values, workers * _CHUNKS_PER_WORKER)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_call, itertools.repeat(function), chunks, itertools.repeat(args),
+                               itertools.repeat(kwargs))
+        return list(itertools.chain.from_iterable(results))
+
+
+def trim(value, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.trim`
+    """
+    return run(str_util.trim, value, workers=workers, threshold=threshold)
+
+
+def lowercase(value, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.lowercase`
+    """
+    return run(str_util.lowercase, value, workers=workers, threshold=threshold)
+
+
+def propercase(value, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.propercase`
+    """
+    return run(str_util.propercase, value, workers=workers, threshold=threshold)
+
+
+def left(value, find, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.left`
+    """
+    return run(str_util.left, value, find, ignore_case, workers=workers, threshold=threshold)
+
+
+def left_back(value, find, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.left_back`
+    """
+    return run(str_util.left_back, value, find, ignore_case, workers=workers, threshold=threshold)
+
+
+def right(value, find, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.right`
+    """
+    return run(str_util.right, value, find, ignore_case, workers=workers, threshold=threshold)
+
+
+def right_back(value, find, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.right_back`
+    """
+    return run(str_util.right_back, value, find, ignore_case, workers=workers, threshold=threshold)
+
+
+def word(value, number, separator=None, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.word`
+    """
+    return run(str_util.word, value, number, separator, workers=workers, threshold=threshold)
+
+
+def replace(source, fromlist, tolist, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.replace`
+    """
+    return run(str_util.replace, source, fromlist, tolist, ignore_case, workers=workers, threshold=threshold)
+
+
+def replace_substring(source, fromlist, tolist, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.replace_substring`
+    """
+    return run(str_util.replace_substring, source, fromlist, tolist, ignore_case, workers=workers,
+               threshold=threshold)
+
+
+def like(string, pattern, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.like`
+    """
+    return run(str_util.like, string, pattern, ignore_case, workers=workers, threshold=threshold)
+
+
+def diff(list1, list2, ignore_case=False, workers=None, threshold=None):
+    """
+    Parallel version of :func:`~str_util.diff`
+    """
+    return run(str_util.diff, list1, list2, ignore_case, workers=workers, threshold=threshold)
@@ -0,0 +1,208 @@
+import time
+
+from str_util import trim, propercase, left, left_back, right, right_back, word, _key, _lookup_set
+from str_util.globbing import compile_like
+from str_util.replace_map import ReplaceMap
+from str_util.replacer import get_replacer
+from str_util.streaming import _iterate, _first_seen
+
+_SKIP = object()  # returned by a step to drop the current value
+
+
+class Pipeline:
+    """
+    Chains several str_util functions, and runs them in a single pass over the values.
+    No intermediate lists are created, so ``Pipeline().trim().lowercase().unique()`` is equivalent to
+    ``unique(lowercase(trim(values)))``, but faster and using less memory.
+
+    Each method adds a stage and returns the pipeline itself. Use :meth:`run` to get a list, or :meth:`iter`
+    to process a stream lazily.
+
+    :param bool timing: Optional. Specify true to measure the time spent in each stage (Default False).
+        After a run, ``timings`` holds a dict for each stage with the ``stage`` name, the ``seconds`` spent,
+        and the number of values going ``in`` and ``out`` of the stage
+
+    >>> clean = Pipeline().trim().replace_substring('_', ' ').lowercase().unique()
+    >>> clean.run(['  Red_Apple', 'red apple ', '  ', 'Green'])
+    ['red apple', 'green']
+
+    >>> timed = Pipeline(timing=True).word(1).filter_like('a*', ignore_case=True)
+    >>> timed.run(['Apple pie', 'Banana split', 'apricot jam'])
+    ['Apple', 'apricot']
+    >>> [(stage['stage'], stage['in'], stage['out']) for stage in timed.timings]
+    [('word', 3, 3), ('filter_like', 3, 2)]
+
+    """
+
+    def __init__(self, timing=False):
+        self.timing = timing
+        self.timings = []
+        self._stages = []
+
+    def __len__(self):
+        return len(self._stages)
+
+    def _add(self, name, factory):
+        """
+        Add a stage. *factory* is called at the start of each run, and returns the function that processes
+        a single value. The function returns the new value, or _SKIP to drop the value
+        """
+        self._stages.append((name, factory))
+        return self
+
+    def _add_map(self, name, function):
+        return self._add(name, lambda: function)
+
+    def map(self, function, name='map'):
+        """
+        Add a stage that applies a function to each value
+        """
+        return self._add_map(name, function)
+
+    def filter(self, function, name='filter'):
+        """
+        Add a stage that only keeps the values where *function(value)* is true
+        """
+        return self._add_map(name, lambda entry: entry if function(entry) else _SKIP)
+
+    def trim(self):
+        """
+        Same as :func:`~str_util.trim`. Empty values are dropped
+        """
+        def step(entry):
+            entry = trim(entry)
+            return entry if entry else _SKIP
+        return self._add_map('trim', step)
+
+    def lowercase(self):
+        """
+        Same as :func:`~str_util.lowercase`
+        """
+        return self._add_map('lowercase', str.casefold)
+
+    def propercase(self):
+        """
+        Same as :func:`~str_util.propercase`
+        """
+        return self._add_map('propercase', propercase)
+
+    def left(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.left`
+        """
+        return self._add_map('left', lambda entry: left(entry, find, ignore_case))
+
+    def left_back(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.left_back`
+        """
+        return self._add_map('left_back', lambda entry: left_back(entry, find, ignore_case))
+
+    def right(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.right`
+        """
+        return self._add_map('right', lambda entry: right(entry, find, ignore_case))
+
+    def right_back(self, find, ignore_case=False):
+        """
+        Same as :func:`~str_util.right_back`
+        """
+        return self._add_map('right_back', lambda entry: right_back(entry, find, ignore_case))
+
+    def word(self, number, separator=None):
+        """
+        Same as :func:`~str_util.word`
+        """
+        return self._add_map('word', lambda entry: word(entry, number, separator))
+
+    def replace(self, fromlist, tolist, ignore_case=False):
+        """
+        Same as :func:`~str_util.replace`
+        """
+        return self._add_map('replace', ReplaceMap(fromlist, tolist, ignore_case).lookup)
+
+    def replace_substring(self, fromlist, tolist, ignore_case=False):
+        """
+        Same as :func:`~str_util.replace_substring`
+        """
+        return self._add_map('replace_substring', get_replacer(fromlist, tolist, ignore_case).replace)
+
+    def filter_like(self, pattern, ignore_case=False):
+        """
+        Only keep the values matching the pattern, see :func:`~str_util.like`
+        """
+        match = compile_like(pattern, ignore_case).match
+        return self._add_map('filter_like', lambda entry: entry if match(entry) else _SKIP)
+
+    def diff(self, list2, ignore_case=False):
+        """
+        Same as :func:`~str_util.diff`. Drop the values found in *list2*
+        """
+        lookup = _lookup_set(list2, ignore_case)
+        return self._add_map('diff', lambda entry: _SKIP if _key(entry, ignore_case) in lookup else entry)
+
+    def unique(self, ignore_case=False, window=None, seconds=None, error_rate=None, capacity=None, clock=None):
+        """
+        Same as :func:`~str_util.unique`. Only keep the first occurrence of each value.
+        The memory can be bounded with the same arguments as :func:`~str_util.streaming.iter_unique`
+        """
+        def factory():
+            first = _first_seen(window, seconds, error_rate, capacity, clock)
+            return lambda entry: entry if first(_key(entry, ignore_case)) else _SKIP
+        return self._add('unique', factory)
+
+    def iter(self, values):
+        """
+        Run the pipeline lazily
+
+        :param iterable values: a string, a list or any other iterable
+        :return: generator with the resulting values
+        """
+        steps = [factory() for _, factory in self._stages]
+        if self.timing:
+            return self._iter_timed(values, steps)
+        return self._iter(values, steps)
+
+    def run(self, values):
+        """
+        Run the pipeline
+
+        :param iterable values: a string, a list or any other iterable
+        :return: the resulting values
+        :rtype: list
+        """
+        return list(self.iter(values))
+
+    __call__ = run
+
+    @staticmethod
+    def _iter(values, steps):
+        for entry in _iterate(values):
+            for step in steps:
+                entry = step(entry)
+                if entry is _SKIP:
+                    break
+            else:
+                yield entry
+
+    def _iter_timed(self, values, steps):
+        seconds = [0.0] * len(steps)
+        counts = [0] * (len(steps) + 1)
+        self.timings = [{'stage': name, 'seconds': 0.0, 'in': 0, 'out': 0} for name, _ in self._stages]
+        clock = time.perf_counter
+        try:
+            for entry in _iterate(values):
+                counts[0] += 1
+                for i, step in enumerate(steps):
+                    start = clock()
+                    entry = step(entry)
+                    seconds[i] += clock() - start
+                    if entry is _SKIP:
+                        break
+                    counts[i + 1] += 1
+                else:
+                    yield entry
+        finally:
+            for i, stage in enumerate(self.timings):
+                stage.update({'seconds': seconds[i], 'in': counts[i], 'out': counts[i + 1]})
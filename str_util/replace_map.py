@@ -0,0 +1,80 @@
+from str_util import to_list, _key
+
+
+class ReplaceMap:
+    """
+    A lookup table for replacing whole values, as done by :func:`~str_util.replace`.
+    A value found in *fromlist* is replaced with the value at the same position in *tolist*.
+    If *tolist* is shorter than *fromlist*, the last value is repeated. If *tolist* is empty,
+    replacing a value found in *fromlist* raises IndexError.
+
+    The table is built once, so each lookup is a single dictionary lookup
+
+    :type fromlist: list or str
+    :param fromlist: Values to search for
+    :type tolist: list or str
+    :param tolist: Values to replace with
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+
+    >>> colors = ReplaceMap(['red', 'green', 'blue'], ['purple', 'silver'])
+    >>> colors.replace(['red', 'yellow', 'green', 'blue'])
+    ['purple', 'yellow', 'silver', 'silver']
+
+    >>> ReplaceMap(['Hej', 'Hi', 'Hello'], 'Greeting', ignore_case=True).lookup('HELLO')
+    'Greeting'
+
+    """
+
+    def __init__(self, fromlist, tolist, ignore_case=False):
+        fromlist = to_list(fromlist)
+        tolist = to_list(tolist)
+        self.ignore_case = ignore_case
+        self._table = {}
+        # values without a replacement, as *tolist* is empty. Replacing them raises IndexError
+        self._missing = set()
+        if tolist:
+            for i, entry in enumerate(fromlist):
+                self._table.setdefault(_key(entry, ignore_case), tolist[min(i, len(tolist) - 1)])
+        else:
+            self._missing.update(_key(entry, ignore_case) for entry in fromlist)
+
+    def __len__(self):
+        return len(self._table) + len(self._missing)
+
+    def __contains__(self, value):
+        key = _key(value, self.ignore_case)
+        return key in self._table or key in self._missing
+
+    def _check_missing(self, values):
+        for value in values:
+            if _key(value, self.ignore_case) in self._missing:
+                raise IndexError('There is no value in tolist to replace %r with' % (value,))
+
+    def lookup(self, value):
+        """
+        Return the replacement for a single value, or the value itself if it should not be replaced
+
+        :param str value: the value to look up
+        :return: the replaced value
+        :rtype: str
+        """
+        if self._missing:
+            self._check_missing([value])
+        return self._table.get(_key(value, self.ignore_case), value)
+
+    def replace(self, source):
+        """
+        Replace all values in a list
+
+        :type source: list or str
+        :param source: The list whose values you want to replace
+        :return: new list with replaced values
+        :rtype: list
+        """
+        source = to_list(source)
+        if self._missing:
+            self._check_missing(source)
+        table = self._table
+        if self.ignore_case:
+            return [table.get(entry.casefold(), entry) for entry in source]
+        return [table.get(entry, entry) for entry in source]
@@ -0,0 +1,77 @@
+import functools
+import re
+
+from str_util import is_list, to_list, _make_equal_length
+
+
+class Replacer:
+    """
+    A compiled set of substring replacements. All words in *fromlist* are found in a single left-to-right scan of
+    the text and replaced with the corresponding value in *tolist*. If *tolist* is shorter than *fromlist*,
+    the last value is repeated. When two words match at the same position, the first one in *fromlist* wins.
+
+    Build the replacer once and reuse it, or just call :func:`~str_util.replace_substring` which keeps a cache
+    of recently used replacers.
+
+    :type fromlist: list or str
+    :param fromlist: Values to search for
+    :type tolist: list or str
+    :param tolist: Values to replace with
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+
+    >>> encode = Replacer(['&', '<', '>'], ['&amp;', '&lt;', '&gt;'])
+    >>> encode.replace('<b>Fish & Chips</b>')
+    '&lt;b&gt;Fish &amp; Chips&lt;/b&gt;'
+
+    Replacements are not applied to text that has already been replaced
+
+    >>> Replacer(['a', 'b'], ['b', 'c']).replace('abc')
+    'bcc'
+
+    >>> Replacer('hippo', 'giraffe', ignore_case=True).replace(['A HIPPO', 'two hippos'])
+    ['A giraffe', 'two giraffes']
+
+    """
+
+    def __init__(self, fromlist, tolist, ignore_case=False):
+        self.fromlist, self.tolist = _make_equal_length(fromlist, tolist)
+        self.ignore_case = ignore_case
+
+        self._pattern = None
+        if self.fromlist:
+            flags = re.IGNORECASE if ignore_case else 0
+            self._pattern = re.compile('|'.join('(' + re.escape(entry) + ')' for entry in self.fromlist), flags)
+
+    def _substitute(self, match):
+        return self.tolist[match.lastindex - 1]
+
+    def replace(self, source):
+        """
+        Replace all words in a string or in each element of a list
+
+        :type source: list or str
+        :param source: Source to be updated with new words
+        :return: string/list where all words are replaced
+        :rtype: list or str
+        """
+        if is_list(source):
+            return [self.replace(entry) for entry in source]
+        if self._pattern is None:
+            return source
+        return self._pattern.sub(self._substitute, source)
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_replacer(fromlist, tolist, ignore_case):
+    return Replacer(list(fromlist), list(tolist), ignore_case)
+
+
+def get_replacer(fromlist, tolist, ignore_case=False):
+    """
+    Return a :class:`Replacer` for the mapping. Recently used replacers are cached and reused
+
+    >>> get_replacer(' ', '_') is get_replacer([' '], ['_'])
+    True
+    """
+    return _cached_replacer(tuple(to_list(fromlist)), tuple(to_list(tolist)), ignore_case)
+
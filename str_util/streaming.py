@@ -0,0 +1,275 @@
+"""
+Lazy versions of the list functions. They accept any iterable (lists, tuples, generators, open files...)
+and yield the results one at a time, so the input never has to be held in memory.
+
+A single string is treated as one value, just like :func:`~str_util.to_list` does
+
+>>> list(iter_trim(('  Hello ', '   ', ' World')))
+['Hello', 'World']
+
+>>> items = ('item %d' % (i % 3) for i in range(1000))
+>>> list(iter_unique(iter_word(items, 2)))
+['0', '1', '2']
+
+"""
+import collections
+import time
+
+from str_util import is_string, trim, propercase, left, right, word, _key, _lookup_set
+from str_util.globbing import compile_like
+from str_util.replace_map import ReplaceMap
+from str_util.replacer import get_replacer
+
+
+def _iterate(values):
+    """
+    Iterate a string as a single value, and everything else as an iterable
+    """
+    if is_string(values):
+        return iter([values])
+    return iter(values)
+
+
+def iter_trim(values):
+    """
+    Lazy version of :func:`~str_util.trim`. Yields the trimmed values, skipping empty values
+
+    :param iterable values: text values
+    """
+    for entry in _iterate(values):
+        entry = trim(entry)
+        if entry:
+            yield entry
+
+
+def iter_lowercase(values):
+    """
+    Lazy version of :func:`~str_util.lowercase`
+
+    :param iterable values: text values
+    """
+    for entry in _iterate(values):
+        yield entry.casefold()
+
+
+def iter_propercase(values):
+    """
+    Lazy version of :func:`~str_util.propercase`
+
+    :param iterable values: text values
+    """
+    for entry in _iterate(values):
+        yield propercase(entry)
+
+
+def iter_left(values, find, ignore_case=False):
+    """
+    Lazy version of :func:`~str_util.left`
+
+    :param iterable values: text values
+    :type find: str or int
+    :param find: a substring to search for, or the number of leftmost chars to return
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    """
+    for entry in _iterate(values):
+        yield left(entry, find, ignore_case)
+
+
+def iter_right(values, find, ignore_case=False):
+    """
+    Lazy version of :func:`~str_util.right`
+
+    :param iterable values: text values
+    :type find: str or int
+    :param find: a substring to search for, or the number of chars to skip
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    """
+    for entry in _iterate(values):
+        yield right(entry, find, ignore_case)
+
+
+def iter_word(values, number, separator=None):
+    """
+    Lazy version of :func:`~str_util.word`
+
+    :param iterable values: text values
+    :param int number: A position indicating which word you want returned. 1 is the first word and -1 is the last word
+    :param separator: Optional (default is any whitespace)
+    """
+    for entry in _iterate(values):
+        yield word(entry, number, separator)
+
+
+def iter_replace(values, fromlist, tolist, ignore_case=False):
+    """
+    Lazy version of :func:`~str_util.replace`
+
+    :param iterable values: The values you want to replace
+    :type fromlist: list or str
+    :param fromlist: Values to search for
+    :type tolist: list or str
+    :param tolist: Values to replace with
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    """
+    lookup = ReplaceMap(fromlist, tolist, ignore_case).lookup
+    for entry in _iterate(values):
+        yield lookup(entry)
+
+
+def iter_replace_substring(values, fromlist, tolist, ignore_case=False):
+    """
+    Lazy version of :func:`~str_util.replace_substring`
+
+    :param iterable values: Values to be updated with new words
+    :type fromlist: list or str
+    :param fromlist: Values to search for
+    :type tolist: list or str
+    :param tolist: Values to replace with
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    """
+    replace = get_replacer(fromlist, tolist, ignore_case).replace
+    for entry in _iterate(values):
+        yield replace(entry)
+
+
+def iter_like(values, pattern, ignore_case=False):
+    """
+    Lazy version of :func:`~str_util.like`. Yields True or False for each value
+
+    :param iterable values: the values to be tested
+    :param str pattern: the pattern. Use ? for any char or * for any sentence.
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    """
+    match = compile_like(pattern, ignore_case).match
+    for entry in _iterate(values):
+        yield match(entry)
+
+
+def iter_diff(values, list2, ignore_case=False):
+    """
+    Lazy version of :func:`~str_util.diff`. Yields the values not found in *list2*.
+    Only *list2* is kept in memory
+
+    :param iterable values: the values to filter
+    :type list2: list or str
+    :param list2: the values to remove
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    """
+    lookup = _lookup_set(list2, ignore_case)
+    for entry in _iterate(values):
+        if _key(entry, ignore_case) not in lookup:
+            yield entry
+
+
+def iter_unique(values, ignore_case=False, window=None, seconds=None, error_rate=None, capacity=None, clock=None):
+    """
+    Lazy version of :func:`~str_util.unique`. Yields the first occurrence of each value.
+    Only the (casefolded) values already seen are kept in memory.
+
+    For endless streams, the memory can be bounded by only remembering the values seen recently. A value is then
+    yielded again, when it hasn't been seen within the last *window* distinct values or the last *seconds*.
+    Seeing a value again makes it recent.
+
+    With *error_rate*, the values are remembered in :class:`~str_util.bloom.BloomFilter` bit arrays instead of a set.
+    This uses a few bytes per value, but a new value is dropped as a duplicate at up to the *error_rate*.
+    When *capacity* values have been seen, a new filter is started and the oldest filter is forgotten,
+    so at most two filters are kept. Each filter is built for half the *error_rate*, as both are checked.
+    A value seen again is added to the newest filter, so it isn't forgotten while it keeps occurring
+
+    :param iterable values: the values
+    :param bool ignore_case: Optional. Specify true to ignore case (Default False)
+    :param int window: Optional. Only remember this many of the most recently seen values
+    :param float seconds: Optional. Only remember the values seen within this many seconds
+    :param float error_rate: Optional. Remember the values approximately, with this rate of false duplicates
+    :param int capacity: Optional. The number of values in each filter when using *error_rate* (default 1000000)
+    :param clock: Optional. Function returning the time in seconds, used with *seconds* (default time.monotonic)
+
+    >>> list(iter_unique(['a', 'b', 'a', 'c', 'a', 'b'], window=2))
+    ['a', 'b', 'c', 'b']
+
+    """
+    first = _first_seen(window, seconds, error_rate, capacity, clock)
+    for entry in _iterate(values):
+        if first(_key(entry, ignore_case)):
+            yield entry
+
+
+def _first_seen(window=None, seconds=None, error_rate=None, capacity=None, clock=None):
+    """
+    Return a function which is called with each key, and returns True if the key hasn't been seen (recently).
+    See :func:`iter_unique` for the arguments
+    """
+    if error_rate is not None:
+        if window is not None or seconds is not None:
+            raise ValueError('error_rate can not be combined with window or seconds')
+        return _ApproximateKeys(capacity or 1000000, error_rate).add
+    if window is not None or seconds is not None:
+        return _RecentKeys(window, seconds, clock).add
+
+    seen = set()
+
+    def first(key):
+        if key in seen:
+            return False
+        seen.add(key)
+        return True
+    return first
+
+
+class _RecentKeys:
+    """
+    The keys seen within the last *window* keys and/or *seconds*, least recently seen first
+    """
+
+    def __init__(self, window=None, seconds=None, clock=None):
+        if window is not None and window < 1:
+            raise ValueError('window must be at least 1')
+        self._window = window
+        self._seconds = seconds
+        self._clock = clock or time.monotonic
+        self._keys = collections.OrderedDict()  # key -> time last seen
+
+    def add(self, key):
+        keys = self._keys
+        now = None
+        if self._seconds is not None:
+            now = self._clock()
+            expired = now - self._seconds
+            while keys:
+                oldest, seen_at = next(iter(keys.items()))
+                if seen_at > expired:
+                    break
+                del keys[oldest]
+
+        new = key not in keys
+        keys[key] = now
+        keys.move_to_end(key)
+        if self._window is not None and len(keys) > self._window:
+            keys.popitem(last=False)
+        return new
+
+
+class _ApproximateKeys:
+    """
+    The keys seen, remembered in two generations of Bloom filters. When the current filter is full,
+    it becomes the previous filter, and the previous filter is forgotten
+    """
+
+    def __init__(self, capacity, error_rate):
+        from str_util.bloom import BloomFilter
+        # a key is looked up in both filters, so each gets half the error rate
+        self._new_filter = lambda: BloomFilter(capacity, error_rate / 2)
+        self._capacity = capacity
+        self._current = self._new_filter()
+        self._previous = None
+
+    def add(self, key):
+        # a key seen in the previous generation is added to the current one too, so it stays remembered
+        # while it keeps being seen
+        new = self._current.add(key)
+        if new and self._previous is not None and key in self._previous:
+            new = False
+        if len(self._current) >= self._capacity:
+            self._previous = self._current
+            self._current = self._new_filter()
+        return new
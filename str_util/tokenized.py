@@ -0,0 +1,75 @@
+import functools
+
+from str_util import is_list, to_list, _word_at
+
+
+class TokenizedText:
+    """
+    A string which is split into words once. Use it when you need several words from the same string, instead of
+    calling :func:`~str_util.word` for each of them.
+
+    :param str value: the sentence
+    :param separator: Optional (default is any whitespace)
+
+    >>> text = TokenizedText('Jakob Majkilde, Denmark')
+    >>> text.word(1), text.word(-1)
+    ('Jakob', 'Denmark')
+    >>> text.words([2, 5])
+    ['Majkilde,', '']
+    >>> len(text)
+    3
+
+    """
+
+    def __init__(self, value, separator=None):
+        self.value = value
+        self.separator = separator
+        self.tokens = value.split(separator)
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __repr__(self):
+        return 'TokenizedText(%r, %r)' % (self.value, self.separator)
+
+    def word(self, number):
+        """
+        Same as :func:`~str_util.word`
+
+        :param int number: 1 is the first word and -1 is the last word
+        :return: the selected word, or '' if there is no such word
+        :rtype: str
+        """
+        return _word_at(self.tokens, number)
+
+    def words(self, numbers):
+        """
+        Same as :func:`~str_util.words`
+
+        :param list numbers: positions of the words you want returned
+        :rtype: list
+        """
+        return [_word_at(self.tokens, number) for number in to_list(numbers)]
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_tokenized(value, separator):
+    return TokenizedText(value, separator)
+
+
+def get_tokenized(value, separator=None):
+    """
+    Return a :class:`TokenizedText` for a string, or a list of them for a list.
+    Recently used strings are cached, so the same string is only split once
+
+    >>> get_tokenized('a b c') is get_tokenized('a b c')
+    True
+    >>> [text.word(-1) for text in get_tokenized(['a b', 'c d'])]
+    ['b', 'd']
+    """
+    if is_list(value):
+        return [_cached_tokenized(entry, separator) for entry in value]
+    return _cached_tokenized(value, separator)
@@ -1,6 +1,15 @@
+import os
+import subprocess
+import sys
 import unittest
 import doctest
 import str_util
+import str_util.parallel
+
+try:
+    import numpy
+except ImportError:  # numpy is optional, only used by str_util.numpy_backend
+    numpy = None
 
 
 class TestStrUtil(unittest.TestCase):
@@ -64,12 +73,526 @@ class TestStrUtil(unittest.TestCase):
         self.assertEqual(str_util.replace_substring('c:\\temp', '\\', '/'), "c:/temp")
         self.assertEqual(str_util.replace_substring('c:/temp/*.*', '/', '\\'), "c:\\temp\\*.*")
 
+    def test_set_operations(self):
+        reference = ['Ref%d' % i for i in range(20000)]
+        values = ['ref%d' % i for i in range(0, 40000, 2)]
+        self.assertEqual(str_util.diff(values, reference, ignore_case=True), values[10000:])
+        self.assertEqual(str_util.intersection(values, reference, ignore_case=True), values[:10000])
+        self.assertFalse(str_util.is_member(values, reference, ignore_case=True))
+        self.assertTrue(str_util.is_member(values[:10000], reference, ignore_case=True))
+        self.assertEqual(str_util.unique(values + reference, ignore_case=True), values + reference[1::2])
+        self.assertEqual(str_util.unique(['b', 'A', 'a', 'B', 'c'], ignore_case=True), ['b', 'A', 'c'])
+        self.assertEqual(str_util.intersection(['A', 'B', 'A'], ['a'], ignore_case=True), ['A', 'A'])
+
+    def test_replacer(self):
+        replacer = str_util.Replacer(['&', '<', '>', '"'], ['&amp;', '&lt;', '&gt;', '&quot;'])
+        self.assertEqual(replacer.replace('<a href="x">&</a>'), '&lt;a href=&quot;x&quot;&gt;&amp;&lt;/a&gt;')
+        self.assertEqual(str_util.Replacer([], []).replace('abc'), 'abc')
+        self.assertEqual(str_util.Replacer(['ab', 'a'], ['1', '2']).replace('aab'), '21')
+        self.assertEqual(str_util.Replacer('SS', 'x', ignore_case=True).replace('ss Ss'), 'x x')
+        self.assertIs(str_util.get_replacer('a', 'b'), str_util.get_replacer(['a'], 'b'))
+
+        fromlist = ['a']
+        str_util.replace_substring('abc', fromlist, ['x', 'y'])
+        self.assertEqual(fromlist, ['a'])
+
+    def test_keyword_matcher(self):
+        keywords = ['word%d' % i for i in range(500)] + ['Der Fluß']
+        text = 'first word42 then der FLUSS and word7'
+        self.assertTrue(str_util.contains(text, keywords))
+        self.assertTrue(str_util.contains([text], keywords + [''], ignore_case=True))
+        self.assertFalse(str_util.contains('nothing here', keywords, ignore_case=True))
+        self.assertFalse(str_util.contains_all(text, keywords, ignore_case=True))
+        self.assertTrue(str_util.contains_all(text, ['word4'] * 300 + ['WORD42'], ignore_case=True))
+
+        matcher = str_util.KeywordMatcher(keywords, ignore_case=True)
+        self.assertEqual(list(matcher.matches(text)), [(6, 'word4'), (6, 'word42'), (18, 'Der Fluß'), (32, 'word7')])
+        self.assertEqual(matcher.keywords([text, 'WORD7']), ['word4', 'word42', 'Der Fluß', 'word7'])
+        self.assertFalse(str_util.KeywordMatcher([]).contains('abc'))
+        self.assertTrue(str_util.KeywordMatcher(['']).contains_all('abc'))
+
+    def test_replace_map(self):
+        fromlist = ['Key%d' % i for i in range(5000)]
+        tolist = ['value%d' % i for i in range(100)]
+        source = ['key%d' % i for i in range(0, 10000, 50)]
+        expected = ['value%d' % min(i, 99) if i < 5000 else 'key%d' % i for i in range(0, 10000, 50)]
+        self.assertEqual(str_util.replace(source, fromlist, tolist, ignore_case=True), expected)
+        self.assertEqual(str_util.replace(source, fromlist, tolist), source)
+
+        mapping = str_util.ReplaceMap(['a', 'A', 'b'], ['1', '2', '3'], ignore_case=True)
+        self.assertEqual(mapping.replace('A'), ['1'])
+        self.assertEqual(len(mapping), 2)
+        self.assertIn('B', mapping)
+
+        self.assertEqual(str_util.replace(['a'], ['x'], []), ['a'])
+        self.assertEqual(str_util.ReplaceMap('x', []).lookup('a'), 'a')
+        self.assertRaises(IndexError, str_util.replace, ['a', 'x'], ['x'], [])
+        self.assertIn('X', str_util.ReplaceMap('x', [], ignore_case=True))
+
+    def test_like(self):
+        self.assertTrue(str_util.like('Straße', 'Stra?e'))
+        self.assertTrue(str_util.like('Straße', 'Stra?e', ignore_case=True))
+        self.assertTrue(str_util.like('STRAßE', 'stra[ß]e', ignore_case=True))
+        self.assertTrue(str_util.like('Der Fluß', 'DER FLUSS', ignore_case=True))
+        self.assertEqual(str_util.compile_like('Stra?e', True).filter(['STRAßE', 'Strasse']), ['STRAßE'])
+        self.assertTrue(str_util.like('JAKOB', 'ja*', ignore_case=True))
+        self.assertFalse(str_util.like('JAKOB', 'ja*'))
+        self.assertEqual(str_util.like(['a.TXT', 'b.txt', 'c.csv'], '*.txt', ignore_case=True), [True, True, False])
+
+        pattern = str_util.compile_like('[a-c]?', ignore_case=True)
+        self.assertIs(pattern, str_util.compile_like('[a-c]?', ignore_case=True))
+        self.assertEqual(pattern.filter(['A1', 'd1', 'c', 'Bx']), ['A1', 'Bx'])
+        self.assertEqual(pattern.mask(['A1', 'd1']), [True, False])
+        self.assertTrue(pattern.match('b2'))
+
+    def test_like_set(self):
+        self.assertEqual(str_util.LikeSet(['Stra?e'], ignore_case=True).first('Straße'), 0)
+        rules = str_util.LikeSet(['x', '*ẞE', 'DER FLUSS'], ignore_case=True)
+        self.assertEqual(rules.matches(['Straße', 'Der Fluß']), [[1], [2]])
+        patterns = ['user%d-*' % i for i in range(1000)] + ['*.log', '*', 'exact', '*-[0-9]']
+        rules = str_util.LikeSet(patterns)
+        self.assertEqual(rules.first('user42-x'), 42)
+        self.assertEqual(rules.matches('user42-1'), [42, 1001, 1003])
+        self.assertEqual(rules.matches('exact'), [1001, 1002])
+        self.assertEqual(rules.first(['a.log', 'b']), [1000, 1001])
+        for value in ['user7-a.log', 'user77-9', 'x', 'EXACT']:
+            self.assertEqual(rules.matches(value), [i for i, pattern in enumerate(patterns)
+                                                    if str_util.like(value, pattern)])
+
+        rules = str_util.LikeSet({'a': 'ABC', 'b': 'a?c'}, ignore_case=True)
+        self.assertEqual(rules.matches('abc'), ['a', 'b'])
+        self.assertIsNone(rules.first('abd'))
+
+    def test_streaming(self):
+        lines = ['  Red  apple ', '', 'green PEAR', 'RED apple']
+        self.assertEqual(list(str_util.iter_trim(iter(lines))), str_util.trim(lines))
+        self.assertEqual(list(str_util.iter_lowercase(tuple(lines))), str_util.lowercase(lines))
+        self.assertEqual(list(str_util.iter_propercase(lines)), str_util.propercase(lines))
+        self.assertEqual(list(str_util.iter_word(lines, 2)), str_util.word(lines, 2))
+        self.assertEqual(list(str_util.iter_left(lines, 'pear', ignore_case=True)), ['', '', 'green ', ''])
+        self.assertEqual(list(str_util.iter_right(lines, 3)), str_util.right(lines, 3))
+        self.assertEqual(list(str_util.iter_replace(lines, '', 'x')), str_util.replace(lines, '', 'x'))
+        self.assertEqual(list(str_util.iter_replace_substring(lines, 'red', 'blue', True)),
+                         str_util.replace_substring(lines, 'red', 'blue', True))
+        self.assertEqual(list(str_util.iter_like(lines, '*apple*')), str_util.like(lines, '*apple*'))
+        self.assertEqual(list(str_util.iter_diff(lines, ['', 'green pear'], True)), ['  Red  apple ', 'RED apple'])
+        words = str_util.iter_word(lines, 1)
+        self.assertEqual(list(str_util.iter_unique(words, True)), ['Red', '', 'green'])
+        self.assertEqual(list(str_util.iter_unique('abc')), ['abc'])
+
+    def test_pipeline(self):
+        lines = ['  Hello_World ', 'hello world', '', 'Foo_bar', 'x']
+        pipeline = str_util.Pipeline().replace_substring('_', ' ').trim().lowercase().unique()
+        expected = str_util.unique(str_util.lowercase(str_util.trim(str_util.replace_substring(lines, '_', ' '))))
+        self.assertEqual(pipeline.run(lines), expected)
+        self.assertEqual(list(pipeline.iter(iter(lines))), expected)
+        self.assertEqual(pipeline(lines), expected)  # state is reset on each run
+        self.assertEqual(len(pipeline), 4)
+
+        pipeline = str_util.Pipeline(timing=True).propercase().diff(['FOO_BAR'], True).right_back(3)
+        self.assertEqual(pipeline.run(lines[3:]), ['X'])
+        self.assertEqual([stage['out'] for stage in pipeline.timings], [2, 1, 1])
+
+        pipeline = str_util.Pipeline().map(len).filter(lambda n: n > 1)
+        self.assertEqual(pipeline.run('abc'), [3])
+
+    def test_parallel(self):
+        values = ['  Value %d  x ' % i for i in range(1000)] + ['  ']
+        parallel = str_util.parallel
+        self.assertEqual(parallel.trim(values, workers=2, threshold=10), str_util.trim(values))
+        self.assertEqual(parallel.word(values, 2, workers=2, threshold=10), str_util.word(values, 2))
+        self.assertEqual(parallel.replace_substring(values, 'VALUE', 'v', True, workers=2, threshold=10),
+                         str_util.replace_substring(values, 'VALUE', 'v', True))
+        self.assertEqual(parallel.like(values, '*1?*', workers=2, threshold=10), str_util.like(values, '*1?*'))
+        self.assertEqual(parallel.diff(values, values[5:], workers=2, threshold=10), values[:5])
+        self.assertEqual(parallel.left('Hello', 2, workers=2, threshold=0), 'He')
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_backend(self):
+        from str_util import numpy_backend
+        values = ['Hello World', 'ab', '', 'Der Fluß', '  lol  ']
+        array = numpy.array(values, dtype=object)
+        for count in range(-8, 9):
+            for name in ['left', 'left_back', 'right', 'right_back']:
+                expected = [getattr(str_util, name)(entry, count) for entry in values]
+                self.assertEqual(getattr(numpy_backend, name)(array, count).tolist(), expected, (name, count))
+        for find in ['l', 'lo', 'xyz']:
+            for name in ['left', 'left_back', 'right', 'right_back']:
+                expected = [getattr(str_util, name)(entry, find) for entry in values]
+                self.assertEqual(getattr(numpy_backend, name)(array, find).tolist(), expected, (name, find))
+
+        self.assertEqual(numpy_backend.trim(array).tolist(), str_util.trim(values))
+        self.assertEqual(numpy_backend.contains(array, ['LO', 'b'], True).tolist(), [True, True, False, False, True])
+        self.assertEqual(numpy_backend.index_of(array, 'AB', ignore_case=True), 1)
+        self.assertEqual(numpy_backend.index_of(array, 'AB'), -1)
+        self.assertEqual(numpy_backend.replace_substring(array, ['l', 'o'], ['o', 'l']).tolist(),
+                         str_util.replace_substring(values, ['l', 'o'], ['o', 'l']))
+        self.assertEqual(numpy_backend.replace_substring(array, 'L', '_', True).tolist(),
+                         str_util.replace_substring(values, 'L', '_', True))
+        for fromlist, tolist in ((['bc', 'ab'], ['X', 'Y']), (['a', 'ab'], ['1', '2']), (['', 'b'], ['-', '+'])):
+            self.assertEqual(numpy_backend.replace_substring(['abc', 'xabcab'], fromlist, tolist).tolist(),
+                             str_util.replace_substring(['abc', 'xabcab'], fromlist, tolist))
+        # words longer than the strings must not match the strings they start with
+        for source, find in ((['ab', 'x'], 'abc'), (['N/A', 'OK'], 'N/A (none)'), (['Hel'], 'Help')):
+            self.assertEqual(numpy_backend.replace_substring(source, find, 'X').tolist(), source)
+        self.assertEqual(numpy_backend.replace_substring([], ['ab'], ['x']).tolist(), [])
+        self.assertEqual(numpy_backend.compare(array, 'ab').tolist(), [-1, 0, -1, -1, -1])
+
+    def test_make_equal_length(self):
+        list1 = ['a']
+        list2 = ['x', 'y', 'z']
+        self.assertEqual(str_util._make_equal_length(list1, list2), (['a', 'a', 'a'], ['x', 'y', 'z']))
+        self.assertEqual(list1, ['a'])  # the source lists are not changed
+
+    def test_instrumentation(self):
+        from str_util import instrumentation
+        original = str_util.left
+        instrumentation.reset()
+        instrumentation.enable()
+        try:
+            self.assertTrue(instrumentation.is_enabled())
+            self.assertIsNot(str_util.left, original)
+            str_util.left(['Hello', 'World'], 'L', True)
+            str_util.left('Hello', 'l', ignore_case=False)
+            str_util.unique(['a', 'A'], True)
+        finally:
+            instrumentation.disable()
+        self.assertIs(str_util.left, original)
+        self.assertFalse(instrumentation.is_enabled())
+
+        stats = instrumentation.stats()
+        self.assertEqual(sorted(stats), ['left', 'unique'])  # index_of called by left is not recorded
+        self.assertEqual(stats['left']['calls'], 2)
+        self.assertEqual(stats['left']['ignore_case_calls'], 1)
+        self.assertEqual(stats['left']['input_length'], {'total': 2, 'max': 2, 'histogram': {'<4': 1}})
+        self.assertEqual(sum(stats['left']['latency_histogram'].values()), 2)
+        self.assertLessEqual(stats['left']['p50_seconds'], stats['left']['max_seconds'])
+        self.assertIn('"unique"', instrumentation.to_json())
+        instrumentation.reset()
+        self.assertEqual(instrumentation.stats(), {})
+
+    def test_lazy_imports(self):
+        script = 'import sys, str_util; print(" ".join(sorted(sys.modules)))'
+        root = os.path.dirname(os.path.dirname(os.path.abspath(str_util.__file__)))
+        modules = subprocess.check_output([sys.executable, '-c', script], cwd=root, universal_newlines=True).split()
+        self.assertNotIn('str_util.replacer', modules)
+        self.assertNotIn('str_util.globbing', modules)
+        self.assertNotIn('fnmatch', modules)
+
+        self.assertIs(str_util.Replacer, str_util.replacer.Replacer)
+        self.assertIn('Pipeline', dir(str_util))
+        with self.assertRaises(AttributeError):
+            str_util.no_such_function
+        from str_util import iter_unique, word  # noqa: F401
+
+    def test_folded(self):
+        import pickle
+        values = ['Straße', 'ABC', 'abc', 'Der Fluß']
+        folded = str_util.FoldedList(values)
+        self.assertEqual(folded, values)
+        self.assertEqual(folded.folded, str_util.lowercase(values))
+        self.assertTrue(str_util.is_list(folded))
+        self.assertTrue(str_util.is_string(folded[0]))
+        self.assertIs(folded[0].casefold(), folded[0].casefold())  # folded once, not on every call
+
+        self.assertEqual(str_util.index_of(folded, 'STRASSE', ignore_case=True), 0)
+        self.assertEqual(str_util.index_of(folded[3], 'FLUSS', ignore_case=True), 4)
+        self.assertTrue(str_util.contains(folded, 'strasse', ignore_case=True))
+        self.assertTrue(str_util.is_member('der fluss', folded, ignore_case=True))
+        self.assertEqual(str_util.sort(folded, ignore_case=True), str_util.sort(values, ignore_case=True))
+        self.assertEqual(str_util.compare(folded[1], folded[2], ignore_case=True), 0)
+        self.assertEqual(str_util.like(folded, 'a*', ignore_case=True), [False, True, True, False])
+        self.assertEqual(str_util.unique(folded, ignore_case=True), ['Straße', 'ABC', 'Der Fluß'])
+
+        self.assertRaises(TypeError, folded.append, 'x')
+        self.assertRaises(TypeError, folded.__setitem__, 0, 'x')
+        self.assertEqual(pickle.loads(pickle.dumps(folded)).folded, folded.folded)
+        self.assertEqual(pickle.loads(pickle.dumps(folded[0])).casefold(), 'strasse')
+
+    def test_is_equal(self):
+        values = ['Value%d' % (i % 1000) for i in range(500000)]
+        shuffled = values[1::2] + values[::2]
+        self.assertTrue(str_util.is_equal(values, shuffled))
+        self.assertTrue(str_util.is_equal(values, str_util.lowercase(shuffled), ignore_case=True))
+        self.assertFalse(str_util.is_equal(values, str_util.lowercase(shuffled)))
+        self.assertFalse(str_util.is_equal(values, shuffled[1:] + ['Value0']))
+        self.assertFalse(str_util.is_equal(values, values[1:]))
+        self.assertTrue(str_util.is_equal('Der Fluß', ['der fluss'], ignore_case=True))
+        self.assertEqual(str_util.index_of(['a', 'B', 'b'], 'b', ignore_case=True), 1)
+        self.assertEqual(str_util.index_of(['a', 'B', 'b'], ['b']), 2)
+
+    def test_list_index(self):
+        import random
+        rnd = random.Random(1)
+        values = [rnd.choice('abcdefABCDEF') for _ in range(200)]
+        index = str_util.ListIndex(values, ignore_case=True)
+        for _ in range(300):
+            value = rnd.choice('abcdefgABCDEFG')
+            self.assertEqual(index.index_of(value), str_util.index_of(values, value, ignore_case=True))
+            if rnd.random() < 0.5 and value in index:
+                index.remove(value)
+                values.pop(str_util.index_of(values, value, ignore_case=True))
+            else:
+                index.append(value)
+                values.append(value)
+            self.assertEqual(len(index), len(values))
+        self.assertEqual(list(index), values)
+
+        index = str_util.ListIndex(['a', 'b', 'c'])
+        self.assertEqual(index.intersection(['c', 'x', 'a']), ['c', 'a'])
+        self.assertEqual(index.diff(['c', 'x', 'A']), ['x', 'A'])
+        self.assertEqual(index.replace(['c', 'x', 'a'], ['1', '2']), ['2', 'x', '1'])
+        self.assertFalse(index.is_member(['a', 'd']))
+        self.assertRaises(ValueError, index.remove, 'd')
+
+    def test_find_all(self):
+        import random
+        import re
+        rnd = random.Random(2)
+        for _ in range(200):
+            text = ''.join(rnd.choice('abAB') for _ in range(rnd.randint(0, 30)))
+            substring = ''.join(rnd.choice('ab') for _ in range(rnd.randint(1, 3)))
+            expected = [match.start() for match in re.finditer(re.escape(substring), text)]
+            self.assertEqual(list(str_util.find_all(text, substring)), expected)
+            expected = [match.start() for match in re.finditer('(?=%s)' % re.escape(substring), text, re.IGNORECASE)]
+            self.assertEqual(list(str_util.find_all(text, substring, ignore_case=True, overlapping=True)), expected)
+
+        self.assertEqual(list(str_util.find_all('abc', '')), [0, 1, 2, 3])
+        self.assertEqual(list(str_util.find_all(['ab', '', 'b'], 'b')), [(0, 1), (2, 0)])
+        self.assertEqual(list(str_util.find_all('ßs', 's', ignore_case=True, overlapping=True)), [0, 1])
+        self.assertEqual(str_util.index_of('Straße ist', 'IST', ignore_case=True), 7)
+        self.assertEqual(str_util.right('Straße ist gut', 'IST ', ignore_case=True), 'gut')
+        self.assertEqual(str_util.right('Straße ist gut', 'STRASSE', ignore_case=True), ' ist gut')
+        self.assertEqual(str_util.right_back('Straße, Straße ist', 'STRASSE', ignore_case=True), ' ist')
+        self.assertEqual(str_util.right('Fluß und Fluss', 'fluß', ignore_case=True), ' und Fluss')
+
+    def test_words(self):
+        import random
+        rnd = random.Random(3)
+        for _ in range(300):
+            text = ''.join(rnd.choice('ab ,') for _ in range(rnd.randint(0, 12)))
+            separator = rnd.choice([None, ',', ', '])
+            tokens = text.split(separator)
+            numbers = [rnd.randint(-6, 6) for _ in range(rnd.randint(1, 3))]
+            expected = [tokens[n - 1 if n > 0 else n] if -len(tokens) <= (n - 1 if n > 0 else n) < len(tokens) else ''
+                        for n in numbers]
+            self.assertEqual(str_util.words(text, numbers, separator), expected)
+            self.assertEqual([str_util.word(text, n, separator) for n in numbers], expected)
+            self.assertEqual(str_util.TokenizedText(text, separator).words(numbers), expected)
+
+        self.assertEqual(str_util.words('a b', []), [])
+        self.assertEqual(str_util.word('a b', -3), '')
+
+    def test_split_columns(self):
+        lines = ['a,b,c', 'd', '', 'e,f']
+        self.assertEqual(str_util.split_columns(lines, ','),
+                         [['a', 'd', '', 'e'], ['b', '', '', 'f'], ['c', '', '', '']])
+        for columns in ([1], [2, -1], [-3, 3, 4]):
+            expected = [str_util.word(lines, number, ',') for number in columns]
+            self.assertEqual(str_util.split_columns(lines, ',', columns), expected)
+        self.assertEqual(str_util.split_columns([], ','), [])
+        self.assertEqual(str_util.split_columns([], ',', [1, 2]), [[], []])
+        self.assertEqual(str_util.split_columns('a b', columns=2), [['b']])
+
+    def test_string_column(self):
+        import tempfile
+        values = ['  Red  Blue ', 'GREEN', '', 'Straße', 'blue sky', 'Red  Blue', 'æøå ÆØÅ']
+        column = str_util.StringColumn(values)
+        self.assertEqual(len(column), len(values))
+        self.assertEqual(list(column), values)
+        self.assertEqual(column[3], 'Straße')
+        self.assertEqual(column[-1], 'æøå ÆØÅ')
+        self.assertEqual(column[2:5].to_list(), values[2:5])
+        self.assertEqual(column[::2].to_list(), values[::2])
+        self.assertEqual(str_util.to_list(column), values)
+
+        for function, args in ((str_util.trim, ()), (str_util.lowercase, ()), (str_util.left, (2,)),
+                               (str_util.right, (' ',)), (str_util.word, (2,)), (str_util.unique, (True,)),
+                               (str_util.sort, (True,))):
+            result = function(column, *args)
+            self.assertIsInstance(result, str_util.StringColumn)
+            self.assertEqual(result.to_list(), function(values, *args))
+        ascii_column = str_util.StringColumn(['Red', 'GREEN'])
+        self.assertEqual(str_util.lowercase(ascii_column).to_list(), ['red', 'green'])
+
+        for substrings in ('Blue', 'blue', ['x', 'ße'], 'uered', 'ÆØ', ['sky', ''], ['nothing']):
+            self.assertEqual(str_util.contains(column, substrings), str_util.contains(values, substrings))
+            self.assertEqual(str_util.contains(column, substrings, True), str_util.contains(values, substrings, True))
+        self.assertFalse(str_util.contains(str_util.StringColumn(['ab', 'cd']), 'bc'))
+        self.assertEqual(str_util.like(column, '*e*'), str_util.like(values, '*e*'))
+
+        with tempfile.TemporaryDirectory() as folder:
+            filename = os.path.join(folder, 'column.bin')
+            column.save(filename)
+            loaded = str_util.StringColumn.load(filename)
+        self.assertEqual(loaded, column)
+        self.assertEqual(loaded.to_list(), values)
+        self.assertLess(column.nbytes, sum(sys.getsizeof(value) for value in values))
+
+        many = ['k5'] * str_util._MATCHER_THRESHOLD
+        self.assertTrue(str_util.contains_all(str_util.StringColumn(['xx k5 yy', 'zz']), many))
+        self.assertTrue(str_util.contains_all(str_util.StringColumn(['xx K5 yy', 'zz']), many, ignore_case=True))
+        self.assertFalse(str_util.contains_all(str_util.StringColumn(['xx K5 yy']), many + ['zz'], ignore_case=True))
+        self.assertTrue(str_util.contains_all(column, ['STRA', 'ß'], ignore_case=True))
+
+        # the column and the results are built in chunks, without a list of all the strings
+        import tracemalloc
+        large = str_util.StringColumn(' value %d ' % i for i in range(50000))
+        for function, args in ((str_util.trim, ()), (str_util.replace_substring, ('value', 'VALUE')),
+                               (str_util.word, (1,))):
+            tracemalloc.start()
+            try:
+                result = function(large, *args)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self.assertEqual(len(result), len(large))
+            self.assertLess(peak, 2 * large.nbytes + 200000, function.__name__)
+
+    def test_encoded_list(self):
+        import random
+        rnd = random.Random(4)
+        distinct = ['Denmark', 'denmark ', 'SWEDEN', 'Norway', '  ', 'United Kingdom', 'DENMARK', 'Straße']
+        values = [rnd.choice(distinct) for _ in range(500)]
+        encoded = str_util.EncodedList(values)
+        self.assertEqual(encoded.to_list(), values)
+        self.assertEqual(len(encoded.values), len(distinct))
+        self.assertEqual(encoded.codes.typecode, 'B')
+        self.assertEqual(encoded[10:20].to_list(), values[10:20])
+        self.assertEqual(encoded[:1].values, values[:1])
+
+        for function, args in ((str_util.trim, ()), (str_util.lowercase, ()), (str_util.propercase, ()),
+                               (str_util.left, (3,)), (str_util.right_back, ('a',)), (str_util.word, (-1,)),
+                               (str_util.replace, (['Norway', 'denmark'], ['NO', 'DK'], True)),
+                               (str_util.replace_substring, ('a', 'A')), (str_util.unique, ()),
+                               (str_util.unique, (True,)), (str_util.sort, ()), (str_util.sort, (True,)),
+                               (str_util.sort, (True, True))):
+            result = function(encoded, *args)
+            self.assertIsInstance(result, str_util.EncodedList)
+            self.assertEqual(result.to_list(), function(values, *args))
+            self.assertEqual(len(set(result.values)), len(result.values))
+
+        self.assertEqual(str_util.like(encoded, 'd*', True), str_util.like(values, 'd*', True))
+        self.assertTrue(str_util.contains(encoded, 'way'))
+        many = ['nmar'] * str_util._MATCHER_THRESHOLD
+        self.assertTrue(str_util.contains_all(encoded, many + ['DEN'], ignore_case=True))
+        self.assertTrue(str_util.contains_all(encoded, many))
+        self.assertFalse(str_util.contains_all(encoded, many + ['way']))
+        self.assertFalse(str_util.contains_all(str_util.EncodedList(), many))
+        self.assertFalse(str_util.contains(str_util.EncodedList(), ''))
+        self.assertEqual(str_util.EncodedList(['a'] * 300 + [str(i) for i in range(300)]).codes.typecode, 'H')
+
+    def test_unique_counts(self):
+        import random
+        rnd = random.Random(5)
+        values = [rnd.choice(['Red', 'red', 'RED', 'Green', 'blue', 'Blue', 'ß', 'SS']) for _ in range(1000)]
+        for ignore_case in (False, True):
+            first = str_util.unique(values, ignore_case)
+            expected = [(value, sum(str_util.is_equal(entry, value, ignore_case) for entry in values))
+                        for value in first]
+            self.assertEqual(str_util.unique_counts(values, ignore_case), expected)
+            top = sorted(expected, key=lambda pair: -pair[1])[:3]
+            self.assertEqual(str_util.unique_counts(values, ignore_case, top_k=3), top)
+            for native in (str_util.EncodedList(values), str_util.StringColumn(values)):
+                self.assertEqual(str_util.unique_counts(native, ignore_case), expected)
+                self.assertEqual(str_util.unique_counts(native, ignore_case, top_k=3), top)
+        self.assertEqual(str_util.unique_counts([]), [])
+        self.assertEqual(str_util.unique_counts(['a'], top_k=0), [])
+
+    def test_bounded_unique(self):
+        from str_util.streaming import iter_unique
+        values = ['a', 'B', 'b', 'c', 'A', 'd', 'a']
+        self.assertEqual(list(iter_unique(values, ignore_case=True, window=2)), ['a', 'B', 'c', 'A', 'd'])
+        self.assertEqual(list(iter_unique(values, ignore_case=True, window=100)), str_util.unique(values, True))
+
+        now = [0.0]
+        clock = lambda: now[0]
+
+        def events():
+            for time_seen, value in ((0, 'a'), (1, 'b'), (2, 'a'), (6, 'b'), (7, 'a'), (13, 'a'), (14, 'b')):
+                now[0] = time_seen
+                yield value
+        self.assertEqual(list(iter_unique(events(), seconds=5, clock=clock)), ['a', 'b', 'b', 'a', 'a', 'b'])
+        pipeline = str_util.Pipeline().unique(seconds=5, clock=clock)
+        self.assertEqual(pipeline.run(['x', 'x']), ['x'])
+
+        values = ['value %d' % i for i in range(5000)] * 2
+        result = list(iter_unique(values, error_rate=0.01))
+        self.assertEqual(len(set(result)), len(result))
+        self.assertGreater(len(result), 4800)
+        self.assertEqual(str_util.Pipeline().unique(error_rate=0.01).run(values), result)
+        # with a small capacity, the values are forgotten after two filters
+        self.assertEqual(len(list(iter_unique(['a', 'b', 'c', 'a'], error_rate=0.001, capacity=1))), 4)
+        # a value that keeps occurring is remembered across filters
+        frequent = [value for i in range(100) for value in ('hot', 'cold %d' % i)]
+        self.assertEqual(list(iter_unique(frequent, error_rate=0.001, capacity=10)).count('hot'), 1)
+        self.assertRaises(ValueError, list, iter_unique(values, window=10, error_rate=0.01))
+
+        bloom = str_util.BloomFilter(1000, error_rate=0.01)
+        for value in values[:1000]:
+            bloom.add(value)
+        self.assertTrue(all(value in bloom for value in values[:1000]))
+        self.assertLess(sum(value in bloom for value in values[1000:3000]), 60)
+        self.assertLess(bloom.nbytes, 1300)
+
+    def test_membership_filter(self):
+        import tempfile
+        reference = ['user %d' % i for i in range(2000)] + ['Straße']
+        probes = ['USER %d' % i for i in range(0, 4000, 7)] + ['strasse', 'STRASSE', 'nobody']
+        for exact in (True, False):
+            members = str_util.MembershipFilter(reference, ignore_case=True, exact=exact)
+            self.assertEqual(len(members), len(reference))
+            expected = str_util.intersection(probes, reference, ignore_case=True)
+            found = str_util.intersection(probes, members, ignore_case=True)
+            if exact:
+                self.assertEqual(found, expected)
+                self.assertEqual(str_util.diff(probes, members, True), str_util.diff(probes, reference, True))
+            else:
+                self.assertTrue(set(expected) <= set(found))
+            self.assertTrue(str_util.is_member(['User 1', 'straße'], members, ignore_case=True))
+
+            with tempfile.TemporaryDirectory() as folder:
+                filename = os.path.join(folder, 'members.bin')
+                members.save(filename)
+                for memory_map in (True, False):
+                    loaded = str_util.MembershipFilter.load(filename, memory_map=memory_map)
+                    self.assertEqual([probe in loaded for probe in probes], [probe in members for probe in probes])
+                    self.assertEqual(loaded.exact, exact)
+                    del loaded
+
+        case_sensitive = str_util.MembershipFilter(['A', 'b'])
+        self.assertEqual(str_util.diff(['A', 'a', 'b'], case_sensitive), ['a'])
+        self.assertRaises(ValueError, str_util.diff, ['a'], case_sensitive, ignore_case=True)
+        self.assertNotIn('', str_util.MembershipFilter([]))
+        index = str_util.ListIndex(['B'], ignore_case=True)
+        self.assertEqual(str_util.diff(['a', 'b', 'c'], index, ignore_case=True), ['a', 'c'])
+        # the lookup and the function must agree on ignore_case, in both directions
+        self.assertRaises(ValueError, str_util.diff, ['a', 'b', 'c'], index)
+        self.assertRaises(ValueError, str_util.is_member, ['b'], index)
+        self.assertRaises(ValueError, str_util.intersection, ['b'], members)
+
     def test_word(self):
         self.assertEqual(str_util.word('a b c', 4), '')
 
     def test_doctest(self):
         suite = unittest.TestSuite()
         suite.addTest(doctest.DocTestSuite("str_util"))
+        suite.addTest(doctest.DocTestSuite("str_util.replacer"))
+        suite.addTest(doctest.DocTestSuite("str_util.replace_map"))
+        suite.addTest(doctest.DocTestSuite("str_util.automaton"))
+        suite.addTest(doctest.DocTestSuite("str_util.globbing"))
+        suite.addTest(doctest.DocTestSuite("str_util.streaming"))
+        suite.addTest(doctest.DocTestSuite("str_util.pipeline"))
+        suite.addTest(doctest.DocTestSuite("str_util.folded"))
+        suite.addTest(doctest.DocTestSuite("str_util.list_index"))
+        suite.addTest(doctest.DocTestSuite("str_util.tokenized"))
+        suite.addTest(doctest.DocTestSuite("str_util.column"))
+        suite.addTest(doctest.DocTestSuite("str_util.encoded"))
+        suite.addTest(doctest.DocTestSuite("str_util.bloom"))
+        suite.addTest(doctest.DocTestSuite("str_util.parallel"))
+        suite.addTest(doctest.DocTestSuite("str_util.instrumentation"))
+        if numpy is not None:
+            suite.addTest(doctest.DocTestSuite("str_util.numpy_backend"))
         result = unittest.TextTestRunner().run(suite)
         self.assertTrue(result.wasSuccessful())
 